@@ -6,12 +6,25 @@ from pathlib import Path
 from typing import List, Optional, Union
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import NoCredentialsError, PartialCredentialsError
 
 from unicloud.abstract_class import AbstractBucket, CloudStorageFactory
 
 logger = logging.getLogger(__name__)
 
+# number of connections kept alive by the client (the botocore default is 10), concurrent transfers need one each.
+MAX_POOL_CONNECTIONS = int(os.environ.get("UNICLOUD_S3_MAX_POOL_CONNECTIONS", 64))
+CLIENT_CONFIG = Config(max_pool_connections=MAX_POOL_CONNECTIONS, tcp_keepalive=True)
+# files larger than the threshold are transferred in parts of `multipart_chunksize` by `max_concurrency` threads.
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=int(os.environ.get("UNICLOUD_S3_MAX_CONCURRENCY", 10)),
+    use_threads=True,
+)
+
 
 class S3(CloudStorageFactory):
     """S3 Cloud Storage."""
@@ -65,6 +78,7 @@ class S3(CloudStorageFactory):
                 region_name=region,
                 aws_access_key_id=aws_access_key_id,
                 aws_secret_access_key=aws_secret_access_key,
+                config=CLIENT_CONFIG,
             )
         except (NoCredentialsError, PartialCredentialsError) as e:
             logger.error("AWS credentials not found.")
@@ -82,7 +96,9 @@ class S3(CloudStorageFactory):
         """
         bucket_name, object_name = bucket_path.split("/", 1)
         try:
-            self.client.upload_file(local_path, bucket_name, object_name)
+            self.client.upload_file(
+                local_path, bucket_name, object_name, Config=TRANSFER_CONFIG
+            )
             logger.info(f"File {local_path} uploaded to {bucket_path}.")
         except Exception as e:
             logger.error("Error uploading file to S3:", exc_info=True)
@@ -100,7 +116,9 @@ class S3(CloudStorageFactory):
         """
         bucket_name, object_name = bucket_path.split("/", 1)
         try:
-            self.client.download_file(bucket_name, object_name, local_path)
+            self.client.download_file(
+                bucket_name, object_name, local_path, Config=TRANSFER_CONFIG
+            )
             logger.info(f"File {bucket_path} downloaded to {local_path}.")
         except Exception as e:
             logger.error("Error downloading file from S3:", exc_info=True)
@@ -130,6 +148,7 @@ class S3(CloudStorageFactory):
             aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
             aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
             region_name=os.getenv("AWS_DEFAULT_REGION"),
+            config=CLIENT_CONFIG,
         )
         bucket = s3.Bucket(bucket_name)
         return Bucket(bucket)
@@ -271,7 +290,9 @@ class Bucket(AbstractBucket):
         """Upload a single file."""
         if not overwrite and self.file_exists(bucket_path):
             raise ValueError(f"File {bucket_path} already exists in the bucket.")
-        self.bucket.upload_file(Filename=str(local_path), Key=bucket_path)
+        self.bucket.upload_file(
+            Filename=str(local_path), Key=bucket_path, Config=TRANSFER_CONFIG
+        )
         logger.info(f"File {local_path} uploaded to {bucket_path}.")
 
     def _upload_directory(self, local_path: Path, bucket_path: str, overwrite: bool):
@@ -336,7 +357,9 @@ class Bucket(AbstractBucket):
 
         local_path.parent.mkdir(parents=True, exist_ok=True)
 
-        self.bucket.download_file(Key=bucket_path, Filename=str(local_path))
+        self.bucket.download_file(
+            Key=bucket_path, Filename=str(local_path), Config=TRANSFER_CONFIG
+        )
         logger.info(f"File {bucket_path} downloaded to {local_path}.")
 
     def _download_directory(self, bucket_path: str, local_path: Path, overwrite: bool):
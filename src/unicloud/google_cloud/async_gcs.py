@@ -0,0 +1,238 @@
+"""Asynchronous Google Cloud Storage."""
+
+import asyncio
+import io
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple, Union
+
+from aiohttp import ClientResponseError
+from gcloud.aio.storage import Storage
+
+from unicloud.utils import decode
+
+logger = logging.getLogger(__name__)
+
+# maximum number of requests in flight at the same time.
+MAX_CONCURRENCY = 100
+
+
+class AsyncBucket:
+    """Asynchronous GCS Bucket.
+
+    All the requests share one aiohttp session and run on a single event loop, which makes this class suited for
+    operations on many small files (deleting or uploading thousands of files), where the time is dominated by the
+    latency of each request rather than the bandwidth.
+    """
+
+    def __init__(
+        self,
+        bucket_name: str,
+        service_key_path: Optional[str] = None,
+        storage: Optional[Storage] = None,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ):
+        """Initialize the AsyncBucket.
+
+        Parameters
+        ----------
+        bucket_name: str
+            The name of the bucket.
+        service_key_path: str, optional, default=None
+            The path to your service key file. If not provided, the `GOOGLE_APPLICATION_CREDENTIALS` and the
+            `SERVICE_KEY_CONTENT` environment variables are used, the same way as in the `GCS` class.
+        storage: Storage, optional, default=None
+            An existing `gcloud.aio.storage.Storage` client to reuse.
+        max_concurrency: int, optional, default=100
+            The maximum number of requests in flight at the same time.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the service key file is provided and does not exist.
+
+        Examples
+        --------
+        >>> async def delete_files(names):  # doctest: +SKIP
+        ...     async with AsyncBucket("my-bucket") as bucket:
+        ...         await bucket.delete_many(names)
+        """
+        if service_key_path is not None and not Path(service_key_path).exists():
+            raise FileNotFoundError(
+                f"The service key file {service_key_path} does not exist"
+            )
+
+        self._name = bucket_name
+        if storage is None:
+            storage = Storage(service_file=self._service_file(service_key_path))
+        self._storage = storage
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @staticmethod
+    def _service_file(
+        service_key_path: Optional[str],
+    ) -> Union[str, io.StringIO, None]:
+        """Get the service account file, `None` lets the storage client use `GOOGLE_APPLICATION_CREDENTIALS`."""
+        if service_key_path is None and "SERVICE_KEY_CONTENT" in os.environ:
+            # key need to be decoded into a dict/json object
+            service_key_content = decode(os.environ["SERVICE_KEY_CONTENT"])
+            return io.StringIO(json.dumps(service_key_content))
+        return service_key_path
+
+    def __str__(self):
+        """__str__."""
+        return f"Bucket: {self.name}"
+
+    def __repr__(self):
+        """__repr__."""
+        return f"Bucket: {self.name}"
+
+    async def __aenter__(self) -> "AsyncBucket":
+        """Enter the async context."""
+        return self
+
+    async def __aexit__(self, *args):
+        """Close the client session when leaving the async context."""
+        await self.close()
+
+    @property
+    def name(self) -> str:
+        """name."""
+        return self._name
+
+    @property
+    def storage(self) -> Storage:
+        """storage."""
+        return self._storage
+
+    async def close(self):
+        """Close the client session."""
+        await self.storage.close()
+
+    async def list_files(self, prefix: Optional[str] = None) -> List[str]:
+        """
+        List files in the GCS bucket.
+
+        Parameters
+        ----------
+        prefix : Optional[str]
+            A prefix to filter files (e.g., 'folder/' to list files under 'folder/').
+
+        Returns
+        -------
+        List[str]
+            A list of file names in the bucket.
+
+        Examples
+        --------
+        >>> async def list_data(bucket: AsyncBucket):  # doctest: +SKIP
+        ...     return await bucket.list_files(prefix="data/")
+        """
+        params = {"fields": "items(name),nextPageToken"}
+        if prefix:
+            params["prefix"] = prefix
+
+        file_names = []
+        while True:
+            response = await self.storage.list_objects(self.name, params=dict(params))
+            file_names.extend(item["name"] for item in response.get("items", []))
+            if "nextPageToken" not in response:
+                return file_names
+            params["pageToken"] = response["nextPageToken"]
+
+    async def delete(self, bucket_path: str):
+        """
+        Delete a file or all files in a directory from the GCS bucket.
+
+        Parameters
+        ----------
+        bucket_path : str
+            The path to the file or directory in the GCS bucket.
+            - For a single file, provide the file name (e.g., "example.txt").
+            - For a directory, provide the path ending with '/' (e.g., "data/").
+
+        Raises
+        ------
+        ValueError
+            If the file or directory does not exist in the bucket.
+
+        Examples
+        --------
+        >>> async def delete_data(bucket: AsyncBucket):  # doctest: +SKIP
+        ...     await bucket.delete("data/")
+        """
+        if bucket_path.endswith("/"):
+            file_names = await self.list_files(prefix=bucket_path)
+            if not file_names:
+                raise ValueError(f"No files found in the directory: {bucket_path}")
+            await self.delete_many(file_names)
+        else:
+            try:
+                await self._delete_file(bucket_path)
+            except ClientResponseError as e:
+                if e.status != 404:
+                    raise
+                raise ValueError(f"File {bucket_path} not found in the bucket.")
+
+    async def delete_many(self, file_names: Iterable[str]):
+        """
+        Delete many files concurrently.
+
+        Parameters
+        ----------
+        file_names : Iterable[str]
+            The names of the files to delete.
+
+        Examples
+        --------
+        >>> async def delete_files(bucket: AsyncBucket):  # doctest: +SKIP
+        ...     await bucket.delete_many(["file1.txt", "data/file2.txt"])
+        """
+        await asyncio.gather(*(self._delete_file(name) for name in file_names))
+
+    async def _delete_file(self, bucket_path: str):
+        async with self._semaphore:
+            await self.storage.delete(self.name, bucket_path)
+        logger.info(f"Deleted file: {bucket_path}")
+
+    async def upload(self, local_path: Union[str, Path], bucket_path: str):
+        """
+        Upload a file to the GCS bucket.
+
+        Parameters
+        ----------
+        local_path : Union[str, Path]
+            The path to the local file to upload.
+        bucket_path : str
+            The destination path in the GCS bucket.
+
+        Examples
+        --------
+        >>> async def upload_file(bucket: AsyncBucket):  # doctest: +SKIP
+        ...     await bucket.upload("local/file.txt", "bucket/folder/file.txt")
+        """
+        async with self._semaphore:
+            await self.storage.upload_from_filename(
+                self.name, bucket_path, str(local_path)
+            )
+        logger.info(f"File '{local_path}' uploaded to '{bucket_path}'.")
+
+    async def upload_many(self, files: Iterable[Tuple[Union[str, Path], str]]):
+        """
+        Upload many files concurrently.
+
+        Parameters
+        ----------
+        files : Iterable[Tuple[Union[str, Path], str]]
+            Pairs of (local path, destination path in the bucket).
+
+        Examples
+        --------
+        >>> async def upload_files(bucket: AsyncBucket):  # doctest: +SKIP
+        ...     await bucket.upload_many([("local/a.txt", "data/a.txt"), ("local/b.txt", "data/b.txt")])
+        """
+        await asyncio.gather(
+            *(self.upload(local_path, bucket_path) for local_path, bucket_path in files)
+        )
@@ -1,19 +1,135 @@
 """Google Cloud Storage."""
 
+import base64
 import fnmatch
+import functools
+import gzip
+import itertools
 import logging
+import mimetypes
 import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import google.auth.credentials
+import google_crc32c
+import requests
+from google.api_core.exceptions import NotFound, PreconditionFailed
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import storage
 from google.oauth2 import service_account
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 
 from unicloud.abstract_class import AbstractBucket, CloudStorageFactory
 from unicloud.utils import decode
 
 logger = logging.getLogger(__name__)
 
+# GCS batch requests accept up to 100 calls per request.
+BATCH_SIZE = 100
+# number of concurrent requests used by operations on many blobs.
+MAX_WORKERS = 16
+# number of connections kept alive by the HTTP session of the client.
+HTTP_POOL_SIZE = int(os.environ.get("UNICLOUD_GCS_HTTP_POOL_SIZE", 64))
+# blobs larger than one chunk are downloaded by `Bucket.download_parallel` using concurrent range requests.
+DOWNLOAD_CHUNK_SIZE = int(
+    os.environ.get("UNICLOUD_GCS_DOWNLOAD_CHUNK_SIZE", 200 * 1024 * 1024)
+)
+DOWNLOAD_WORKERS = 10
+# files larger than the threshold are uploaded in parallel parts and composed into one object, the parts are at
+# least `COMPOSITE_CHUNK_SIZE` bytes and at most 32 (the maximum number of sources of one compose request).
+COMPOSITE_THRESHOLD = int(
+    os.environ.get("UNICLOUD_GCS_COMPOSITE_THRESHOLD", 150 * 1024 * 1024)
+)
+COMPOSITE_CHUNK_SIZE = int(
+    os.environ.get("UNICLOUD_GCS_COMPOSITE_CHUNK_SIZE", 50 * 1024 * 1024)
+)
+MAX_COMPOSE_SOURCES = 32
+# chunk size of resumable uploads (must be a multiple of 256 KiB).
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+# partial responses of the listings, only the metadata that is used afterwards is fetched.
+LIST_FIELDS = "items(name),nextPageToken"
+# `updated` is used by `download_to_filename` to set the modification time of the local file.
+DOWNLOAD_LIST_FIELDS = "items(name,updated),nextPageToken"
+# content types that are gzip-compressed by uploads with `compress=True`, other types are usually compressed already.
+COMPRESSIBLE_TYPES = frozenset(
+    {
+        "application/json",
+        "application/xml",
+        "application/geo+json",
+        "application/javascript",
+    }
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_glob(pattern: str) -> re.Pattern:
+    """Compile a glob pattern into a regular expression."""
+    return re.compile(fnmatch.translate(pattern))
+
+
+def _walk(root: Union[str, Path]) -> Iterator[Path]:
+    """Yield the files under a local directory recursively.
+
+    `os.scandir` returns the type of each entry with the directory listing, so unlike `Path.rglob` no extra `stat`
+    call is needed to tell files from directories.
+    """
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk(entry.path)
+            elif entry.is_file():
+                yield Path(entry.path)
+
+
+def _ensure_pool_size(session: requests.Session, size: int) -> None:
+    """Mount a connection pool of at least `size` connections on an HTTP session.
+
+    The pool is only replaced when it is smaller than `size`, so the pool mounted by `GCS.create_client` (and the
+    connections it keeps alive) is shared by all the buckets of a client. The size of the mounted pool is kept on
+    the session, a session without it has the default pool of `requests`.
+    """
+    if getattr(session, "_unicloud_pool_size", DEFAULT_POOLSIZE) >= size:
+        return
+    session.mount("https://", HTTPAdapter(pool_connections=size, pool_maxsize=size))
+    session._unicloud_pool_size = size
+
+
+def _run_bounded(
+    func: Callable, tasks: Iterable[Tuple[Any, ...]], max_workers: int
+) -> None:
+    """Run `func(*task)` for each task in a thread pool, consuming the tasks lazily.
+
+    At most `max_workers * 4` tasks are submitted but not finished at any time, so a long generator of tasks is
+    never materialized. No new task is submitted after a task fails, and the first exception is re-raised once the
+    running tasks are finished.
+    """
+    semaphore = threading.BoundedSemaphore(max_workers * 4)
+    errors = []
+
+    def _done(future):
+        if future.exception() is not None:
+            errors.append(future.exception())
+        semaphore.release()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for task in tasks:
+            semaphore.acquire()
+            if errors:
+                semaphore.release()
+                break
+            executor.submit(func, *task).add_done_callback(_done)
+
+    if errors:
+        raise errors[0]
+
 
 class GCS(CloudStorageFactory):
     """GCS Cloud Storage."""
@@ -162,27 +278,36 @@ class GCS(CloudStorageFactory):
             If the GOOGLE_APPLICATION_CREDENTIALS and the EE_PRIVATE_KEY and EE_SERVICE_ACCOUNT are not in your env
             variables you have to provide a path to your service account file.
         """
+        project = self.project_id
         if self.service_key:
             credentials = service_account.Credentials.from_service_account_file(
                 self.service_key
             )
-            client = storage.Client(project=self.project_id, credentials=credentials)
         elif "GOOGLE_APPLICATION_CREDENTIALS" in os.environ:
             credentials = service_account.Credentials.from_service_account_file(
                 os.environ["GOOGLE_APPLICATION_CREDENTIALS"]
             )
-            client = storage.Client(project=self.project_id, credentials=credentials)
         elif "SERVICE_KEY_CONTENT" in os.environ:
             # key need to be decoded into a dict/json object
             service_key_content = decode(os.environ["SERVICE_KEY_CONTENT"])
-            client = storage.Client.from_service_account_info(service_key_content)
+            credentials = service_account.Credentials.from_service_account_info(
+                service_key_content
+            )
+            project = service_key_content.get("project_id")
         else:
             raise ValueError(
                 "Since the GOOGLE_APPLICATION_CREDENTIALS and the SERVICE_KEY_CONTENT are not in your env variables "
                 "you have to provide a path to your service account"
             )
 
-        return client
+        # the client only scopes its own copy of the credentials, so the session needs scoped ones to get a token.
+        credentials = google.auth.credentials.with_scopes_if_required(
+            credentials, storage.Client.SCOPE
+        )
+        # one authorized session keeps the connections (and their TLS handshakes) alive between requests.
+        session = AuthorizedSession(credentials)
+        _ensure_pool_size(session, max(HTTP_POOL_SIZE, MAX_WORKERS))
+        return storage.Client(project=project, credentials=credentials, _http=session)
 
     def upload(self, local_path: str, bucket_path: str):
         """Upload a file to GCS.
@@ -265,9 +390,45 @@ class GCS(CloudStorageFactory):
 class Bucket(AbstractBucket):
     """GCSBucket."""
 
-    def __init__(self, bucket: storage.bucket.Bucket):
-        """Initialize the GCSBucket."""
+    def __init__(
+        self,
+        bucket: storage.bucket.Bucket,
+        workers: int = MAX_WORKERS,
+        cache_ttl: float = 0.0,
+        negative_cache_ttl: float = 0.0,
+    ):
+        """Initialize the GCSBucket.
+
+        Parameters
+        ----------
+        bucket: storage.bucket.Bucket
+            The GCS bucket.
+        workers: int, optional, default=16
+            The number of concurrent requests used by operations on many blobs. If the connection pool of the
+            client's HTTP session is smaller (the default pool keeps only 10 connections), it is enlarged to the same
+            number, so the concurrent requests do not wait for a free connection. A larger pool is kept as is.
+        cache_ttl: float, optional, default=0
+            The number of seconds the results of `file_exists` and `list_files` are cached. The cached entries are
+            invalidated by the uploads, deletes and renames done through this object, but not by changes made by
+            other clients. The default (0) disables the cache.
+        negative_cache_ttl: float, optional, default=0
+            The number of seconds a file reported missing by `file_exists` is cached, when it is longer than
+            `cache_ttl`. Repeated checks for files that are not there yet then cost no request, and an upload through
+            this object still invalidates the entry.
+        """
         self._bucket = bucket
+        self._workers = workers
+        self._cache_ttl = cache_ttl
+        self._negative_cache_ttl = negative_cache_ttl
+        self._cache_lock = threading.Lock()
+        self._exists_cache: Dict[str, Tuple[bool, float]] = {}
+        self._list_cache: Dict[
+            Tuple[Optional[str], Optional[int], Optional[str]], Tuple[List[str], float]
+        ] = {}
+        # only a requests session (the default transport of the client) has a pool to resize.
+        session = getattr(bucket.client, "_http", None)
+        if isinstance(session, requests.Session):
+            _ensure_pool_size(session, workers)
 
     def __str__(self):
         """__str__."""
@@ -292,6 +453,7 @@ class Bucket(AbstractBucket):
         prefix: Optional[str] = None,
         max_results: Optional[int] = None,
         pattern: Optional[str] = None,
+        use_cache: bool = True,
     ) -> List[str]:
         """
         List files in the GCS bucket with optional filtering and limits.
@@ -304,6 +466,9 @@ class Bucket(AbstractBucket):
             Maximum number of files to list.
         pattern : Optional[str]
             A glob pattern to filter files (e.g., '*.txt', 'data/*.csv').
+        use_cache : bool, optional
+            If False, the bucket is listed again even if a cached listing is still valid, the new listing
+            replaces the cached one. Only relevant when the bucket was created with a `cache_ttl`. Default is True.
 
         Returns
         -------
@@ -325,15 +490,103 @@ class Bucket(AbstractBucket):
 
         List the first 10 files:
             >>> files = my_bucket.list_files(max_results=10)    # doctest: +SKIP
+
+        List the text files:
+            >>> files = my_bucket.list_files(pattern="*.txt")    # doctest: +SKIP
+
+        Skip the cached listing:
+            >>> files = my_bucket.list_files(use_cache=False)    # doctest: +SKIP
+
+        Notes
+        -----
+        - Simple patterns (using only `*` wildcards) are also sent to GCS as a `match_glob`, so only the matching
+          files are fetched from the bucket, and `max_results` limits the number of matching files.
+
+        See Also
+        --------
+        iter_files : To iterate over the file names lazily without building the whole list.
+        """
+        key = (prefix, max_results, pattern)
+        if use_cache and self._cache_ttl > 0:
+            cached = self._list_cache.get(key)
+            if cached is not None and cached[1] > time.monotonic():
+                return list(cached[0])
+
+        file_names = list(
+            self.iter_files(prefix=prefix, max_results=max_results, pattern=pattern)
+        )
+        if self._cache_ttl > 0:
+            with self._cache_lock:
+                self._list_cache[key] = (
+                    list(file_names),
+                    time.monotonic() + self._cache_ttl,
+                )
+        return file_names
+
+    def iter_files(
+        self,
+        prefix: Optional[str] = None,
+        max_results: Optional[int] = None,
+        pattern: Optional[str] = None,
+    ) -> Iterator[str]:
         """
-        blobs = self.bucket.list_blobs(prefix=prefix, max_results=max_results)
-        file_names = [blob.name for blob in blobs]
+        Iterate over the files in the GCS bucket with optional filtering and limits.
+
+        The file names are yielded as the pages of the listing arrive, so the whole listing is never held in
+        memory, and the caller can stop early without fetching the remaining pages.
 
-        # Apply pattern matching if a pattern is provided
+        Parameters
+        ----------
+        prefix : Optional[str]
+            A prefix to filter files (e.g., 'folder/' to list files under 'folder/').
+        max_results : Optional[int]
+            Maximum number of files to list.
+        pattern : Optional[str]
+            A glob pattern to filter files (e.g., '*.txt', 'data/*.csv').
+
+        Yields
+        ------
+        str
+            The file names in the bucket.
+
+        Examples
+        --------
+        >>> Bucket_ID = "test-bucket"
+        >>> PROJECT_ID = "py-project-id"
+        >>> gcs = GCS(PROJECT_ID)   # doctest: +SKIP
+        >>> my_bucket = gcs.get_bucket(Bucket_ID)   # doctest: +SKIP
+
+        Find the first csv file in a folder:
+            >>> name = next(my_bucket.iter_files(prefix="data/", pattern="*.csv"), None)  # doctest: +SKIP
+        """
+        match_glob = self._to_match_glob(pattern) if pattern else None
+        # without a server-side filter, the limit can only be applied after the pattern matching.
+        server_max_results = None if pattern and match_glob is None else max_results
+        blobs = self.bucket.list_blobs(
+            prefix=prefix,
+            max_results=server_max_results,
+            match_glob=match_glob,
+            fields=LIST_FIELDS,
+        )
+        file_names = (blob.name for blob in blobs)
+
+        # Apply pattern matching if a pattern is provided, the pattern is compiled once and reused between listings.
         if pattern:
-            file_names = [name for name in file_names if fnmatch.fnmatch(name, pattern)]
+            file_names = filter(_compile_glob(pattern).match, file_names)
 
-        return file_names
+        yield from itertools.islice(file_names, max_results)
+
+    @staticmethod
+    def _to_match_glob(pattern: str) -> Optional[str]:
+        """Translate a simple fnmatch pattern into a GCS `match_glob` expression.
+
+        In fnmatch `*` matches any character including `/`, which is `**` in GCS globs. Patterns that use other
+        wildcards (`?`, `[...]`) or characters with a special meaning in GCS globs (`{...}`, `\\`) are not
+        translated and return None, as their semantics differ between the two syntaxes.
+        """
+        if set(pattern) & set("?[]{}\\"):
+            return None
+        return re.sub(r"\*+", "**", pattern)
 
     def get_file(self, blob_id) -> storage.blob.Blob:
         """
@@ -387,15 +640,41 @@ class Bucket(AbstractBucket):
         >>> my_bucket.file_exists("nonexistent.txt")  # doctest: +SKIP
         False
         """
-        blob = self.bucket.get_blob(file_name)
-        return False if blob is None else True
+        cached = self._exists_cache.get(file_name)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+
+        exists = self.bucket.blob(file_name).exists(self.bucket.client)
+        ttl = (
+            self._cache_ttl
+            if exists
+            else max(self._cache_ttl, self._negative_cache_ttl)
+        )
+        if ttl > 0:
+            with self._cache_lock:
+                self._exists_cache[file_name] = (exists, time.monotonic() + ttl)
+        return exists
+
+    def _invalidate_cache(self, file_name: str) -> None:
+        """Drop the cached existence of a file and the cached listings that may contain it."""
+        if self._cache_ttl <= 0 and self._negative_cache_ttl <= 0:
+            return
+
+        with self._cache_lock:
+            self._exists_cache.pop(file_name, None)
+            for key in list(self._list_cache):
+                prefix = key[0]
+                if not prefix or file_name.startswith(prefix):
+                    del self._list_cache[key]
 
     def upload(
         self,
-        local_path: Union[str, Path],
+        local_path: Union[str, Path, bytes],
         bucket_path: Union[str, Path],
         overwrite: bool = False,
-    ):
+        max_workers: Optional[int] = None,
+        compress: bool = False,
+    ) -> Optional[storage.blob.Blob]:
         """Upload a file to GCS.
 
         Uploads a file or an entire directory to a Google Cloud Storage bucket.
@@ -405,16 +684,30 @@ class Bucket(AbstractBucket):
 
         Parameters
         ----------
-        local_path : Union[str, Path]
+        local_path : Union[str, Path, bytes]
             The path to the local file or directory to upload.
             - For a single file, provide the full path to the file (e.g., "path/to/file.txt").
             - For a directory, provide the path to the directory (e.g., "path/to/directory/").
+            - For content already in memory, provide the bytes, they are uploaded with `upload_bytes`.
         bucket_path : str
             The destination path in the GCS bucket where the file(s) will be uploaded.
             - For a single file, provide the full path (e.g., "bucket/folder/file.txt").
             - For a directory upload, provide the base path (e.g., "bucket/folder/").
         overwrite : bool, optional
             If True, overwrite existing files. Default is False.
+        max_workers : int, optional
+            The number of files uploaded concurrently when `local_path` is a directory. Default is the `workers`
+            of the bucket.
+        compress : bool, optional
+            If True, text files (text/*, json, xml, ...) are gzip-compressed before the upload and stored with
+            `Content-Encoding: gzip`, GCS decompresses them on download. Bytes are compressed whatever their
+            content. Default is False.
+
+        Returns
+        -------
+        Optional[storage.blob.Blob]
+            The uploaded blob when a single file is uploaded, its `generation` confirms the upload without listing
+            the bucket. None for directories.
 
         Raises
         ------
@@ -441,23 +734,96 @@ class Bucket(AbstractBucket):
         - For directory uploads, the relative structure of the local directory will be preserved in the GCS bucket.
         - Ensure the `bucket_path` is valid and writable.
         """
+        if isinstance(local_path, bytes):
+            return self.upload_bytes(
+                local_path, bucket_path, overwrite, compress=compress
+            )
+
         local_path = Path(local_path)
 
         if not local_path.exists():
             raise FileNotFoundError(f"The local path {local_path} does not exist.")
 
         if local_path.is_file():
-            self._upload_file(local_path, bucket_path, overwrite)
+            return self._upload_file(local_path, bucket_path, overwrite, compress)
         elif local_path.is_dir():
-            self._upload_directory(local_path, bucket_path, overwrite)
+            self._upload_directory(
+                local_path, bucket_path, overwrite, max_workers, compress
+            )
+            return None
         else:
             raise ValueError(
                 f"The local path {local_path} is neither a file nor a directory."
             )
 
+    def upload_bytes(
+        self,
+        data: bytes,
+        bucket_path: str,
+        overwrite: bool = False,
+        content_type: str = "application/octet-stream",
+        compress: bool = False,
+    ) -> storage.blob.Blob:
+        """Upload in-memory content to GCS without writing it to a local file.
+
+        Parameters
+        ----------
+        data : bytes
+            The content to upload.
+        bucket_path : str
+            The destination path in the GCS bucket (e.g., "bucket/folder/file.bin").
+        overwrite : bool, optional
+            If True, overwrite the file if it exists in the bucket. Default is False.
+        content_type : str, optional
+            The content type of the uploaded file. Default is "application/octet-stream".
+        compress : bool, optional
+            If True, the content is gzip-compressed before the upload and stored with `Content-Encoding: gzip`,
+            whatever its content type. Default is False.
+
+        Returns
+        -------
+        storage.blob.Blob
+            The uploaded blob, with the metadata (e.g. `generation`) returned by the upload request.
+
+        Raises
+        ------
+        ValueError
+            If the file exists in the bucket and `overwrite` is False.
+
+        Examples
+        --------
+        >>> Bucket_ID = "test-bucket"
+        >>> PROJECT_ID = "py-project-id"
+        >>> gcs = GCS(PROJECT_ID) # doctest: +SKIP
+        >>> my_bucket = gcs.get_bucket(Bucket_ID) # doctest: +SKIP
+        >>> my_bucket.upload_bytes(b"some content", "bucket/folder/file.txt") # doctest: +SKIP
+        """
+        blob = self.bucket.blob(bucket_path)
+        if compress:
+            data = gzip.compress(data, compresslevel=1)
+            blob.content_encoding = "gzip"
+
+        try:
+            blob.upload_from_string(
+                data,
+                content_type=content_type,
+                if_generation_match=None if overwrite else 0,
+            )
+        except PreconditionFailed:
+            raise ValueError(
+                f"The file '{bucket_path}' already exists in the bucket and overwrite is set to False."
+            )
+        self._invalidate_cache(bucket_path)
+        logger.info(f"{len(data)} bytes uploaded to '{bucket_path}'.")
+        return blob
+
     def _upload_file(
-        self, local_path: Path, bucket_path: str, overwrite: bool = False
-    ) -> None:
+        self,
+        local_path: Path,
+        bucket_path: str,
+        overwrite: bool = False,
+        compress: bool = False,
+    ) -> storage.blob.Blob:
         """
         Upload a single file to GCS with overwrite handling.
 
@@ -470,6 +836,13 @@ class Bucket(AbstractBucket):
         overwrite : bool
             If True, the method overwrites the file if it already exists in the bucket. If False, raises
             a `ValueError` if the destination file already exists.
+        compress : bool, optional
+            If True and the file is a text file, it is uploaded gzip-compressed. Default is False.
+
+        Returns
+        -------
+        storage.blob.Blob
+            The uploaded blob, with the metadata (e.g. `generation`) returned by the upload request.
 
         Raises
         ------
@@ -503,21 +876,147 @@ class Bucket(AbstractBucket):
             "The file 'bucket/folder/file.txt' already exists in the bucket and overwrite is set to False."
         """
         blob = self.bucket.blob(bucket_path)
-
-        if not overwrite and blob.exists():
+        # with `if_generation_match=0` the request fails if the object exists, so the existence is checked by the
+        # upload itself instead of a separate request.
+        if_generation_match = None if overwrite else 0
+        file_size = local_path.stat().st_size
+        content_type = mimetypes.guess_type(local_path)[0]
+
+        try:
+            if compress and self._is_compressible(content_type):
+                self._upload_compressed(
+                    local_path, blob, content_type, if_generation_match
+                )
+            elif file_size >= COMPOSITE_THRESHOLD:
+                # compose checks the precondition only after all the parts are uploaded, a cheap request first
+                # avoids transferring them for nothing (raising the error compose would), the precondition
+                # still covers an object created during the upload.
+                if if_generation_match == 0 and blob.exists():
+                    raise PreconditionFailed(f"{bucket_path} already exists")
+                self._upload_composite(
+                    local_path, blob, file_size, content_type, if_generation_match
+                )
+            else:
+                blob.chunk_size = UPLOAD_CHUNK_SIZE
+                blob.upload_from_filename(
+                    local_path, if_generation_match=if_generation_match
+                )
+        except PreconditionFailed:
             raise ValueError(
                 f"The file '{bucket_path}' already exists in the bucket and overwrite is set to False."
             )
-
-        blob.upload_from_filename(str(local_path))
+        self._invalidate_cache(bucket_path)
         logger.info(f"File '{local_path}' uploaded to '{bucket_path}'.")
+        return blob
+
+    @staticmethod
+    def _upload_compressed(
+        local_path: Path,
+        blob: storage.blob.Blob,
+        content_type: Optional[str] = None,
+        if_generation_match: Optional[int] = None,
+    ) -> None:
+        """Upload a file gzip-compressed, streaming it through a temporary file instead of loading it in memory."""
+        with tempfile.TemporaryFile() as compressed:
+            # text compresses well, the fastest level already removes most of the bytes to transfer.
+            with open(local_path, "rb") as f, gzip.GzipFile(
+                fileobj=compressed, mode="wb", compresslevel=1
+            ) as gz:
+                shutil.copyfileobj(f, gz, UPLOAD_CHUNK_SIZE)
+            size = compressed.tell()
+            compressed.seek(0)
+            blob.content_encoding = "gzip"
+            # a resumable upload sends the compressed file in chunks, whatever its size.
+            blob.chunk_size = UPLOAD_CHUNK_SIZE
+            blob.upload_from_file(
+                compressed,
+                size=size,
+                content_type=content_type,
+                if_generation_match=if_generation_match,
+            )
+
+    @staticmethod
+    def _is_compressible(content_type: Optional[str]) -> bool:
+        """Check if a content type is a text format worth compressing."""
+        if content_type is None:
+            return False
+        return content_type.startswith("text/") or content_type in COMPRESSIBLE_TYPES
+
+    def _upload_composite(
+        self,
+        local_path: Path,
+        blob: storage.blob.Blob,
+        file_size: int,
+        content_type: Optional[str] = None,
+        if_generation_match: Optional[int] = None,
+    ) -> None:
+        """Upload a large file in parallel parts, then compose the parts into the destination blob.
+
+        The composed object has a CRC32C checksum but no MD5 hash. The parts are deleted once composed, or when
+        the upload fails. The `if_generation_match` precondition is checked by the compose request.
+        """
+        num_parts = min(MAX_COMPOSE_SOURCES, max(1, file_size // COMPOSITE_CHUNK_SIZE))
+        part_size = -(-file_size // num_parts)
+        offsets = range(0, file_size, part_size)
+        sizes = [min(part_size, file_size - start) for start in offsets]
+        # a unique name per upload, so the parts never collide with existing objects or with concurrent uploads.
+        part_prefix = f"{blob.name}.{uuid.uuid4().hex}.part"
+        parts = [self.bucket.blob(f"{part_prefix}{i}") for i in range(len(offsets))]
+        if content_type is not None:
+            # the compose request creates the destination with the metadata of the blob.
+            blob.content_type = content_type
+
+        try:
+            with ThreadPoolExecutor(max_workers=self._workers) as executor:
+                # consume the results to re-raise any exception from the workers.
+                list(
+                    executor.map(
+                        self._upload_part,
+                        itertools.repeat(local_path),
+                        parts,
+                        offsets,
+                        sizes,
+                    )
+                )
+            blob.compose(parts, if_generation_match=if_generation_match)
+        except Exception:
+            # some parts may not have been uploaded, a failed cleanup must not hide the upload error.
+            for part in parts:
+                try:
+                    part.delete()
+                except NotFound:
+                    pass
+                except Exception as e:
+                    logger.warning(
+                        f"Could not delete the upload part '{part.name}': {e}"
+                    )
+            raise
+
+        self._delete_blobs(parts)
+
+    @staticmethod
+    def _upload_part(
+        local_path: Path, part: storage.blob.Blob, start: int, size: int
+    ) -> None:
+        """Upload `size` bytes of a local file, starting at the `start` offset."""
+        part.chunk_size = UPLOAD_CHUNK_SIZE
+        with open(local_path, "rb") as f:
+            f.seek(start)
+            part.upload_from_file(f, size=size, rewind=False)
 
     def _upload_directory(
-        self, local_path: Path, bucket_path: str, overwrite: bool = False
+        self,
+        local_path: Path,
+        bucket_path: str,
+        overwrite: bool = False,
+        max_workers: Optional[int] = None,
+        compress: bool = False,
     ):
         """
         Upload an entire directory, including subdirectories, to GCS.
 
+        The files are uploaded concurrently by a pool of threads.
+
         Parameters
         ----------
         local_path : Path
@@ -528,6 +1027,10 @@ class Bucket(AbstractBucket):
         overwrite : bool
             If True, overwrites existing files in the bucket. If False, raises a `ValueError`
             for any existing files.
+        max_workers : int, optional
+            The number of files uploaded concurrently. Default is the `workers` of the bucket.
+        compress : bool, optional
+            If True, the text files are uploaded gzip-compressed. Default is False.
 
         Raises
         ------
@@ -565,16 +1068,25 @@ class Bucket(AbstractBucket):
         if local_path.is_dir() and not any(local_path.iterdir()):
             raise ValueError(f"Directory {local_path} is empty.")
 
-        for file in local_path.rglob("*"):
-            if file.is_file():
-                relative_path = file.relative_to(local_path)
-                bucket_file_path = (
-                    f"{bucket_path.rstrip('/')}/{relative_path.as_posix()}"
-                )
-                self._upload_file(file, bucket_file_path, overwrite)
+        # the directory is walked lazily while the files are uploaded.
+        files = _walk(local_path)
+        tasks = (
+            (
+                file,
+                f"{bucket_path.rstrip('/')}/{file.relative_to(local_path).as_posix()}",
+                overwrite,
+                compress,
+            )
+            for file in files
+        )
+        _run_bounded(self._upload_file, tasks, max_workers or self._workers)
 
     def download(
-        self, bucket_path: str, local_path: Union[Path, str], overwrite: bool = False
+        self,
+        bucket_path: str,
+        local_path: Union[Path, str],
+        overwrite: bool = False,
+        max_workers: Optional[int] = None,
     ):
         """Download a file from GCS.
 
@@ -596,6 +1108,9 @@ class Bucket(AbstractBucket):
             - For a directory download, provide the base path (e.g., "local/data/").
         overwrite : bool, optional, default is False.
             If True, overwrites existing local files. Default is False.
+        max_workers : int, optional
+            The number of files downloaded concurrently when `bucket_path` is a directory. Default is the `workers`
+            of the bucket.
 
         Raises
         ------
@@ -636,7 +1151,7 @@ class Bucket(AbstractBucket):
 
         """
         if bucket_path.endswith("/"):
-            self._download_directory(bucket_path, local_path, overwrite)
+            self._download_directory(bucket_path, local_path, overwrite, max_workers)
         else:
             self._download_file(bucket_path, local_path, overwrite)
 
@@ -661,6 +1176,7 @@ class Bucket(AbstractBucket):
             If the source file does not exist in the bucket.
         ValueError
             If the destination path exists and overwrite is False.
+            Or if the file is downloaded in chunks and its crc32c checksum does not match the blob.
 
         Examples
         --------
@@ -677,7 +1193,10 @@ class Bucket(AbstractBucket):
         local_path = Path(local_path)
         blob = self.bucket.blob(bucket_path)
 
-        if not blob.exists():
+        try:
+            # one request both checks the existence and fetches the size of the blob.
+            blob.reload()
+        except NotFound:
             raise FileNotFoundError(
                 f"The file '{bucket_path}' does not exist in the bucket."
             )
@@ -688,15 +1207,24 @@ class Bucket(AbstractBucket):
             )
 
         local_path.parent.mkdir(parents=True, exist_ok=True)
-        blob.download_to_filename(str(local_path))
+        self._download_sized_blob(
+            blob, local_path, DOWNLOAD_CHUNK_SIZE, DOWNLOAD_WORKERS
+        )
         logger.info(f"File '{bucket_path}' downloaded to '{local_path}'.")
 
     def _download_directory(
-        self, cloud_path: str, local_path: Union[str, Path], overwrite: bool = False
+        self,
+        cloud_path: str,
+        local_path: Union[str, Path],
+        overwrite: bool = False,
+        max_workers: Optional[int] = None,
     ) -> None:
         """
         Download a directory from GCS.
 
+        The blobs are listed once, the local directories are created up front, then the files are downloaded
+        concurrently by a pool of threads.
+
         Parameters
         ----------
         cloud_path : str
@@ -705,6 +1233,8 @@ class Bucket(AbstractBucket):
             The local destination for the downloaded directory.
         overwrite : bool, optional, default is False.
             If True, overwrites existing local files.
+        max_workers : int, optional
+            The number of files downloaded concurrently. Default is the `workers` of the bucket.
 
         Raises
         ------
@@ -726,29 +1256,159 @@ class Bucket(AbstractBucket):
         ... ) # doctest: +SKIP
         """
         local_path = Path(local_path)
-        blobs = list(self.bucket.list_blobs(prefix=cloud_path))
+        blobs = list(
+            self.bucket.list_blobs(prefix=cloud_path, fields=DOWNLOAD_LIST_FIELDS)
+        )
 
-        if not any(blobs):
+        if not blobs:
             raise FileNotFoundError(
                 f"The directory '{cloud_path}' does not exist in the bucket."
             )
 
-        for blob in blobs:
-            if blob.name.endswith("/"):
-                continue  # Skip "directory" entries
+        # Skip "directory" entries
+        blobs = [blob for blob in blobs if not blob.name.endswith("/")]
+        local_file_paths = [
+            local_path / Path(blob.name).relative_to(cloud_path) for blob in blobs
+        ]
+
+        if not overwrite:
+            for local_file_path in local_file_paths:
+                if local_file_path.exists():
+                    raise ValueError(
+                        f"The destination file '{local_file_path}' already exists and overwrite is set to False."
+                    )
+
+        for directory in {path.parent for path in local_file_paths}:
+            directory.mkdir(parents=True, exist_ok=True)
+
+        with ThreadPoolExecutor(max_workers=max_workers or self._workers) as executor:
+            # consume the results to re-raise any exception from the workers.
+            list(executor.map(self._download_blob, blobs, local_file_paths))
+
+    @staticmethod
+    def _download_blob(blob: storage.blob.Blob, local_path: Path) -> None:
+        """Download a blob to a local file."""
+        blob.download_to_filename(local_path)
+        logger.info(f"File '{blob.name}' downloaded to '{local_path}'.")
+
+    def download_parallel(
+        self,
+        bucket_path: str,
+        local_path: Union[str, Path],
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+        workers: int = DOWNLOAD_WORKERS,
+        overwrite: bool = False,
+    ) -> None:
+        """Download a single large file from GCS using concurrent range requests.
+
+        The file is split into chunks of `chunk_size` bytes, each chunk is downloaded with its own ranged GET
+        request, and written directly to its offset in the local file. Files that fit in a single chunk are
+        downloaded with one request, the same as `download`.
 
-            relative_path = Path(blob.name).relative_to(cloud_path)
-            local_file_path = local_path / relative_path
+        Parameters
+        ----------
+        bucket_path : str
+            The source file in the GCS bucket.
+        local_path : Union[str, Path]
+            The local destination for the downloaded file.
+        chunk_size : int, optional, default is 200 MB.
+            The size of each range request in bytes. The default can be changed with the
+            `UNICLOUD_GCS_DOWNLOAD_CHUNK_SIZE` environment variable.
+        workers : int, optional, default is 10.
+            The number of chunks downloaded concurrently.
+        overwrite : bool, optional, default is False.
+            If True, overwrites the file if it already exists.
 
-            if local_file_path.exists() and not overwrite:
+        Raises
+        ------
+        FileNotFoundError
+            If the source file does not exist in the bucket.
+        ValueError
+            If the destination path exists and overwrite is False.
+            Or if the file is downloaded in chunks and its crc32c checksum does not match the blob.
+
+        Examples
+        --------
+        >>> Bucket_ID = "test-bucket"
+        >>> PROJECT_ID = "py-project-id"
+        >>> gcs = GCS(PROJECT_ID)  # doctest: +SKIP
+        >>> my_bucket = gcs.get_bucket(Bucket_ID)   # doctest: +SKIP
+        >>> my_bucket.download_parallel("large-file.tif", "local/large-file.tif")  # doctest: +SKIP
+
+        Use smaller chunks and more workers:
+            >>> my_bucket.download_parallel(
+            ...     "large-file.tif",
+            ...     "local/large-file.tif",
+            ...     chunk_size=50 * 1024 * 1024,
+            ...     workers=16,
+            ... )  # doctest: +SKIP
+        """
+        local_path = Path(local_path)
+        blob = self.bucket.get_blob(bucket_path)
+
+        if blob is None:
+            raise FileNotFoundError(
+                f"The file '{bucket_path}' does not exist in the bucket."
+            )
+
+        if local_path.exists() and not overwrite:
+            raise ValueError(
+                f"The destination file '{local_path}' already exists and overwrite is set to False."
+            )
+
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        self._download_sized_blob(blob, local_path, chunk_size, workers)
+        logger.info(f"File '{bucket_path}' downloaded to '{local_path}'.")
+
+    def _download_sized_blob(
+        self,
+        blob: storage.blob.Blob,
+        local_path: Path,
+        chunk_size: int,
+        workers: int,
+    ) -> None:
+        """Download a blob with loaded metadata, using range requests if it is larger than one chunk."""
+        # range requests are not applied to gzip-encoded blobs that GCS decompresses on the fly.
+        if blob.size > chunk_size and blob.content_encoding != "gzip":
+            self._download_chunks(blob, local_path, chunk_size, workers)
+        else:
+            blob.download_to_filename(str(local_path))
+
+    @staticmethod
+    def _download_chunks(
+        blob: storage.blob.Blob, local_path: Path, chunk_size: int, workers: int
+    ) -> None:
+        """Download a blob in chunks of `chunk_size` bytes, each written at its offset in `local_path`."""
+        # preallocate the file, so the chunks can be written in any order.
+        with open(local_path, "wb") as f:
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(f.fileno(), 0, blob.size)
+            else:
+                f.truncate(blob.size)
+
+        def _download_chunk(start: int):
+            end = min(start + chunk_size, blob.size) - 1
+            with open(local_path, "r+b") as f:
+                f.seek(start)
+                # the checksum covers the whole object, so it cannot be validated per range.
+                blob.download_to_file(f, start=start, end=end, checksum=None)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_download_chunk, range(0, blob.size, chunk_size)))
+
+        # validate the assembled file against the object's checksum instead.
+        if blob.crc32c is not None:
+            checksum = google_crc32c.Checksum()
+            with open(local_path, "rb") as f:
+                for data in iter(lambda: f.read(chunk_size), b""):
+                    checksum.update(data)
+            if base64.b64encode(checksum.digest()).decode("utf-8") != blob.crc32c:
+                local_path.unlink()
                 raise ValueError(
-                    f"The destination file '{local_file_path}' already exists and overwrite is set to False."
+                    f"The crc32c checksum of the downloaded file does not match the blob {blob.name}, "
+                    f"the file has been deleted."
                 )
 
-            local_file_path.parent.mkdir(parents=True, exist_ok=True)
-            blob.download_to_filename(local_file_path)
-            logger.info(f"File '{blob.name}' downloaded to '{local_file_path}'.")
-
     def delete(self, bucket_path: str):
         """
         Delete a file or all files in a directory from the GCS bucket.
@@ -794,25 +1454,34 @@ class Bucket(AbstractBucket):
             self._delete_file(bucket_path)
 
     def _delete_directory(self, bucket_path: str):
-        blobs = self.bucket.list_blobs(prefix=bucket_path)
-        deleted_files = []
+        blobs = list(self.bucket.list_blobs(prefix=bucket_path, fields=LIST_FIELDS))
+        if not blobs:
+            raise ValueError(f"No files found in the directory: {bucket_path}")
+
+        self._delete_blobs(blobs)
         for blob in blobs:
-            blob.delete()
-            deleted_files.append(blob.name)
             logger.info(f"Deleted file: {blob.name}")
 
-        if not deleted_files:
-            raise ValueError(f"No files found in the directory: {bucket_path}")
+    def _delete_blobs(self, blobs: List[storage.blob.Blob]):
+        """Delete blobs in batch requests of up to `BATCH_SIZE` deletes each."""
+        # deletes are metadata operations, so they can be grouped in batch requests.
+        for group in itertools.batched(blobs, BATCH_SIZE):
+            with self.bucket.client.batch():
+                for blob in group:
+                    blob.delete()
+        for blob in blobs:
+            self._invalidate_cache(blob.name)
 
     def _delete_file(self, bucket_path: str):
         blob = self.bucket.blob(bucket_path)
         if blob.exists():
             blob.delete()
+            self._invalidate_cache(bucket_path)
             logger.info(f"Blob {bucket_path} deleted.")
         else:
             raise ValueError(f"File {bucket_path} not found in the bucket.")
 
-    def rename(self, old_path: str, new_path: str):
+    def rename(self, old_path: str, new_path: str) -> List[str]:
         """
         Rename a file or directory in the GCS bucket.
 
@@ -826,6 +1495,12 @@ class Bucket(AbstractBucket):
         new_path : str
             The new path for the file or directory in the bucket.
 
+        Returns
+        -------
+        List[str]
+            The names of the renamed files at their new path, so callers do not need to check their existence
+            with extra requests.
+
         Raises
         ------
         ValueError
@@ -850,26 +1525,32 @@ class Bucket(AbstractBucket):
 
         Rename a directory:
             >>> my_bucket.rename("bucket/old_dir/", "bucket/new_dir/") # doctest: +SKIP
+            ['bucket/new_dir/file1.txt', 'bucket/new_dir/subdir/file2.txt']
         """
         # Check if the old path exists
-        blobs = list(self.bucket.list_blobs(prefix=old_path))
+        blobs = list(self.bucket.list_blobs(prefix=old_path, fields=LIST_FIELDS))
         if not blobs:
             raise ValueError(f"The path '{old_path}' does not exist in the bucket.")
 
         # Check if the new path already exists
-        if any(self.bucket.list_blobs(prefix=new_path)):
+        if any(
+            self.bucket.list_blobs(prefix=new_path, max_results=1, fields=LIST_FIELDS)
+        ):
             raise ValueError(f"The destination path '{new_path}' already exists.")
 
-        # Perform the rename
-        for blob in blobs:
-            old_blob_name = blob.name
-            if old_path.endswith("/") and not old_blob_name.startswith(old_path):
-                continue  # Skip unrelated files
-            new_blob_name = old_blob_name.replace(old_path, new_path, 1)
-            # create a copy of the blob to the new path
-            new_blob = self.bucket.blob(new_blob_name)
-            new_blob.rewrite(blob)
-            # delete the original blob
-            blob.delete()
+        new_blob_names = [blob.name.replace(old_path, new_path, 1) for blob in blobs]
+
+        # create a copy of each blob at the new path, the copies are independent requests.
+        with ThreadPoolExecutor(max_workers=self._workers) as executor:
+            list(executor.map(self._copy_blob, blobs, new_blob_names))
+
+        # delete the original blobs once all the copies succeeded
+        self._delete_blobs(blobs)
 
         logger.info(f"Renamed '{old_path}' to '{new_path}'.")
+        return new_blob_names
+
+    def _copy_blob(self, blob: storage.blob.Blob, new_blob_name: str):
+        """Copy a blob to a new name in the same bucket."""
+        self.bucket.blob(new_blob_name).rewrite(blob)
+        self._invalidate_cache(new_blob_name)
@@ -43,7 +43,8 @@ def encode(secret_file: Union[str, Any]) -> bytes:
 
     """
     if isinstance(secret_file, str) and os.path.exists(secret_file):
-        content: dict = json.load(open(secret_file))
+        with open(secret_file) as f:
+            content: dict = json.load(f)
     elif isinstance(secret_file, dict):
         # Direct dictionary input
         content: dict = secret_file
@@ -80,5 +81,6 @@ def decode(string: bytes) -> Dict[str, str]:
         >>> decode(encoded_content)
         {'type': 'service_account', 'project_id': 'example-project_id'}
     """
-    service_key = json.loads(base64.b64decode(string).decode())
+    # json.loads accepts the decoded bytes directly, no intermediate str is needed.
+    service_key = json.loads(base64.b64decode(string))
     return service_key
@@ -4,36 +4,46 @@ import os
 from pathlib import Path
 
 import boto3
+import pytest
 from moto import mock_aws
 
-from unicloud.aws.aws import S3, Bucket
+from unicloud.aws.aws import MAX_POOL_CONNECTIONS, S3, Bucket
 
 MY_TEST_BUCKET = "testing-unicloud"
 MOCK_BUCKET_NAME = "testing-fake-name"
 
 
+@pytest.mark.xdist_group(name="s3_mock")
 class TestS3Mock:
     """Test the S3 class."""
 
-    def setup_method(self):
-        """Set up the S3 client."""
-        self.mock = mock_aws()
-        self.mock.start()
+    @classmethod
+    def setup_class(cls):
+        """Start the S3 mock and create the mock bucket once for the whole class."""
+        cls.mock = mock_aws()
+        cls.mock.start()
 
-        self.my_s3 = S3()
+        cls.my_s3 = S3()
 
         # Create a mock S3 bucket
-        self.bucket_name = MOCK_BUCKET_NAME
-        self.my_s3.client.create_bucket(
-            Bucket=self.bucket_name,
+        cls.bucket_name = MOCK_BUCKET_NAME
+        cls.my_s3.client.create_bucket(
+            Bucket=cls.bucket_name,
             CreateBucketConfiguration={
                 "LocationConstraint": os.getenv("AWS_DEFAULT_REGION", "us-east-1")
             },
         )
 
-    def teardown_method(self):
+    @classmethod
+    def teardown_class(cls):
         """Stop the S3 mock."""
-        self.mock.stop()
+        cls.mock.stop()
+
+    def teardown_method(self):
+        """Empty the mock bucket, so each test starts from an empty bucket."""
+        response = self.my_s3.client.list_objects_v2(Bucket=self.bucket_name)
+        for obj in response.get("Contents", []):
+            self.my_s3.client.delete_object(Bucket=self.bucket_name, Key=obj["Key"])
 
     def test_upload(self, test_file: str):
         """Test uploading data to S3."""
@@ -48,7 +58,9 @@ class TestS3Mock:
         object_keys = [obj["Key"] for obj in response.get("Contents", [])]
         assert object_name in object_keys
 
-    def test_download_data(self, test_file: str, test_file_content: str):
+    def test_download_data(
+        self, test_file: str, test_file_content: str, tmp_path: Path
+    ):
         """Test downloading data from S3."""
 
         bucket_name = MOCK_BUCKET_NAME
@@ -58,14 +70,21 @@ class TestS3Mock:
         self.my_s3.client.put_object(
             Bucket=self.bucket_name, Key=object_name, Body=test_file_content
         )
-        download_path = "tests/data/test-download-aws.txt"
-        self.my_s3.download(bucket_path, download_path)
+        download_path = tmp_path / "test-download-aws.txt"
+        self.my_s3.download(bucket_path, str(download_path))
 
         # Verify the file was downloaded correctly
-        with open(download_path, "r") as f:
-            assert f.read() == test_file_content
+        assert download_path.read_text() == test_file_content
+
+    def test_client_connection_pool(self):
+        """Test the client keeps a pool large enough for concurrent transfers."""
+        config = self.my_s3.client.meta.config
+        assert config.max_pool_connections == MAX_POOL_CONNECTIONS
+        assert config.tcp_keepalive
 
 
+@pytest.mark.e2e
+@pytest.mark.xdist_group(name="s3_e2e")
 class TestS3E2E:
     """End-to-end tests for the S3 class."""
 
@@ -79,15 +98,14 @@ class TestS3E2E:
         response = boto_client.list_objects_v2(Bucket=MY_TEST_BUCKET)
         assert self.file_name in [obj["Key"] for obj in response["Contents"]]
 
-    def test_s3_download(self, unicloud_s3, test_file_content: str):
+    def test_s3_download(self, unicloud_s3, test_file_content: str, tmp_path: Path):
         """Test file download from S3."""
 
-        download_path = Path("tests/data/aws-test-file.txt")
+        download_path = tmp_path / "aws-test-file.txt"
         unicloud_s3.download(f"{MY_TEST_BUCKET}/{self.file_name}", download_path)
 
         # Verify the file content
         assert download_path.read_text() == test_file_content
-        os.remove(download_path)
 
     def test_get_bucket(self, unicloud_s3):
         """Test getting a bucket object."""
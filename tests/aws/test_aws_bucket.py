@@ -7,9 +7,11 @@ from unittest.mock import MagicMock, call, patch
 import boto3
 import pytest
 
-from unicloud.aws.aws import Bucket
+from unicloud.aws.aws import TRANSFER_CONFIG, Bucket
 
 
+@pytest.mark.e2e
+@pytest.mark.xdist_group(name="s3_bucket_e2e")
 class TestBucketE2E:
     """
     End-to-End tests for the Bucket class.
@@ -48,7 +50,7 @@ class TestBucketE2E:
         self.bucket.upload(local_dir, f"{bucket_path}/")
         objects = [obj.key for obj in self.bucket.bucket.objects.all()]
         expected_files = upload_test_data["expected_files"]
-        assert set(objects) & expected_files == expected_files
+        assert expected_files <= set(objects)
         self.bucket.delete(f"{bucket_path}/")
 
     def test_upload_overwrite(self, test_file: Path):
@@ -172,10 +174,12 @@ class TestBucketE2E:
         self.bucket.rename(old_dir, new_dir)
 
         # Verify files under the new directory exist and old directory does not
-        for file in upload_test_data["expected_files"]:
-            new_file = file.replace("upload-dir", "new_directory")
-            assert self.bucket.file_exists(new_file)
-            assert not self.bucket.file_exists(file)
+        new_files = frozenset(
+            file.replace("upload-dir", "new_directory")
+            for file in upload_test_data["expected_files"]
+        )
+        assert new_files <= set(self.bucket.list_files(prefix=new_dir))
+        assert not self.bucket.list_files(prefix=old_dir)
 
         self.bucket.delete(new_dir)
 
@@ -219,7 +223,7 @@ class TestUploadMock:
         ):
             self.bucket.upload(local_file, "test.txt")
         self.mock_bucket.upload_file.assert_called_once_with(
-            Filename=str(local_file), Key="test.txt"
+            Filename=str(local_file), Key="test.txt", Config=TRANSFER_CONFIG
         )
 
     def test_upload_directory(self):
@@ -239,7 +243,7 @@ class TestUploadMock:
         for file in files:
             s3_path = f"test_dir/{file.name}"
             self.mock_bucket.upload_file.assert_any_call(
-                Filename=str(file), Key=s3_path
+                Filename=str(file), Key=s3_path, Config=TRANSFER_CONFIG
             )
 
     def test_upload_empty_directory_mock(self):
@@ -273,7 +277,7 @@ class TestDownloadMock:
             self.bucket.download("test.txt", str(local_file))
 
         self.mock_bucket.download_file.assert_called_once_with(
-            Key="test.txt", Filename=str(local_file)
+            Key="test.txt", Filename=str(local_file), Config=TRANSFER_CONFIG
         )
 
     def test_download_directory(self):
@@ -293,7 +297,7 @@ class TestDownloadMock:
         for obj in mock_objects:
             expected_path = local_dir / Path(obj.key).relative_to("test_dir/")
             self.mock_bucket.download_file.assert_any_call(
-                Key=obj.key, Filename=str(expected_path)
+                Key=obj.key, Filename=str(expected_path), Config=TRANSFER_CONFIG
             )
 
     def test_download_empty_directory_mock(self):
@@ -307,6 +311,8 @@ class TestDownloadMock:
                 self.bucket.download("empty-dir/", "local-empty-dir/")
 
 
+@pytest.mark.e2e
+@pytest.mark.xdist_group(name="s3_delete_e2e")
 class TestDeleteE2E:
     """
     End-to-End tests for the Bucket class delete method.
@@ -8,6 +8,41 @@ import pytest
 from unicloud.aws.aws import S3
 
 S3_BUCKET_NAME = "testing-unicloud"
+# environment variables holding the credentials used by the E2E tests of each provider (test directory).
+E2E_CREDENTIALS = {
+    "aws": ("AWS_ACCESS_KEY_ID",),
+    "google_cloud": ("GOOGLE_APPLICATION_CREDENTIALS", "SERVICE_KEY_CONTENT"),
+}
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-e2e",
+        action="store_true",
+        default=False,
+        help="run the end-to-end tests against the real cloud buckets.",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip the E2E tests of a provider unless `--run-e2e` is passed or the credentials of the provider are set.
+
+    Without credentials the E2E tests only fail after the HTTP retries time out.
+    """
+    if config.getoption("--run-e2e"):
+        return
+
+    for item in items:
+        if "e2e" not in item.keywords:
+            continue
+        provider = item.path.parent.name
+        env_vars = E2E_CREDENTIALS.get(provider, ())
+        if not any(env_var in os.environ for env_var in env_vars):
+            item.add_marker(
+                pytest.mark.skip(
+                    reason=f"needs --run-e2e or one of {', '.join(env_vars)}"
+                )
+            )
 
 
 @pytest.fixture
@@ -34,11 +69,13 @@ def test_file_content() -> str:
 def upload_test_data() -> Dict[str, Path]:
     local_dir = Path("tests/data/upload-dir")
     bucket_path = "upload-dir"
-    expected_files = {
-        f"{bucket_path}/file1.txt",
-        f"{bucket_path}/subdir/file2.txt",
-        f"{bucket_path}/subdir/file3.log",
-    }
+    expected_files = frozenset(
+        {
+            f"{bucket_path}/file1.txt",
+            f"{bucket_path}/subdir/file2.txt",
+            f"{bucket_path}/subdir/file3.log",
+        }
+    )
     return {
         "local_dir": local_dir,
         "bucket_path": bucket_path,
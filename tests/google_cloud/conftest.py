@@ -0,0 +1,29 @@
+import pytest
+
+from unicloud.google_cloud.gcs import GCS, Bucket
+
+GCS_PROJECT_ID = "earth-engine-415620"
+GCS_BUCKET_NAME = "testing-repositories"
+
+
+@pytest.fixture(scope="session")
+def gcs_bucket_name() -> str:
+    return GCS_BUCKET_NAME
+
+
+@pytest.fixture(scope="session")
+def gcs_client() -> GCS:
+    """One GCS client for the whole session, so the connections and the auth token are reused between tests."""
+    return GCS(GCS_PROJECT_ID)
+
+
+@pytest.fixture(scope="session")
+def gcs_bucket(gcs_client: GCS, gcs_bucket_name: str) -> Bucket:
+    """The E2E test bucket, shared by all the E2E tests.
+
+    The bucket metadata is loaded once here, the tests reuse it instead of fetching it again. The request also
+    warms up the session client, so no test pays for the token fetch and the TCP/TLS handshake.
+    """
+    bucket = gcs_client.get_bucket(gcs_bucket_name)
+    bucket.bucket.reload()
+    return bucket
@@ -0,0 +1,86 @@
+""" Tests for the AsyncBucket class. """
+
+from unittest.mock import AsyncMock, MagicMock, call
+
+import pytest
+from aiohttp import ClientResponseError
+
+from unicloud.google_cloud.async_gcs import AsyncBucket
+
+
+@pytest.mark.mock
+class TestAsyncDeleteMock:
+
+    def setup_method(self):
+        self.mock_storage = AsyncMock()
+        self.bucket = AsyncBucket("test_bucket", storage=self.mock_storage)
+
+    @pytest.mark.asyncio
+    async def test_delete_directory(self):
+        self.mock_storage.list_objects.return_value = {
+            "items": [{"name": "data/file1.txt"}, {"name": "data/subdir/file2.txt"}]
+        }
+
+        await self.bucket.delete("data/")
+
+        self.mock_storage.list_objects.assert_awaited_once_with(
+            "test_bucket",
+            params={"fields": "items(name),nextPageToken", "prefix": "data/"},
+        )
+        self.mock_storage.delete.assert_has_awaits(
+            [
+                call("test_bucket", "data/file1.txt"),
+                call("test_bucket", "data/subdir/file2.txt"),
+            ],
+            any_order=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete_directory_empty(self):
+        self.mock_storage.list_objects.return_value = {}
+
+        directory = "empty_directory/"
+        with pytest.raises(
+            ValueError, match=f"No files found in the directory: {directory}"
+        ):
+            await self.bucket.delete(directory)
+
+        self.mock_storage.delete.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_delete_single_file_not_found(self):
+        self.mock_storage.delete.side_effect = ClientResponseError(
+            MagicMock(), (), status=404
+        )
+
+        file_name = "non_existent_file.txt"
+        with pytest.raises(
+            ValueError, match=f"File {file_name} not found in the bucket."
+        ):
+            await self.bucket.delete(file_name)
+
+    @pytest.mark.asyncio
+    async def test_list_files_pages(self):
+        self.mock_storage.list_objects.side_effect = [
+            {"items": [{"name": "file1.txt"}], "nextPageToken": "token"},
+            {"items": [{"name": "file2.txt"}]},
+        ]
+
+        files = await self.bucket.list_files()
+
+        assert files == ["file1.txt", "file2.txt"]
+        assert self.mock_storage.list_objects.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_upload_many(self):
+        await self.bucket.upload_many(
+            [("local/a.txt", "data/a.txt"), ("local/b.txt", "data/b.txt")]
+        )
+
+        self.mock_storage.upload_from_filename.assert_has_awaits(
+            [
+                call("test_bucket", "data/a.txt", "local/a.txt"),
+                call("test_bucket", "data/b.txt", "local/b.txt"),
+            ],
+            any_order=True,
+        )
@@ -1,182 +1,220 @@
 """ Tests for the GCS class. """
 
-import os
+from contextlib import ExitStack
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
 import pytest
+from google.auth.credentials import AnonymousCredentials
+from google.auth.transport.requests import AuthorizedSession
+from google.cloud import storage
+from google.oauth2 import service_account
 
-from unicloud.google_cloud.gcs import GCS, Bucket
-
-MY_TEST_BUCKET = "testing-repositories"
-PROJECT_ID = "earth-engine-415620"
+from unicloud.google_cloud.gcs import GCS, HTTP_POOL_SIZE, Bucket
 
 
+@pytest.mark.xdist_group(name="gcs_mock")
 class TestGCSMock:
-    @pytest.fixture(autouse=True)
-    def mock_gcs_client(self):
-        """Mock the create_client method for all tests."""
-        with patch("unicloud.google_cloud.gcs.GCS.create_client") as mock_create:
-            mock_create.return_value = Mock()
-            yield mock_create
+    @pytest.fixture(autouse=True, scope="class")
+    @classmethod
+    def _patches(cls):
+        """Start the patches once for the whole class instead of once per test."""
+        with ExitStack() as stack:
+            gcs_mocks = stack.enter_context(
+                patch.multiple(
+                    "unicloud.google_cloud.gcs.GCS",
+                    create_client=DEFAULT,
+                    client=DEFAULT,
+                )
+            )
+            cls.mock_create_client = gcs_mocks["create_client"]
+            cls.mock_client = gcs_mocks["client"]
+            cls.mock_bucket = stack.enter_context(patch("google.cloud.storage.Bucket"))
+            yield
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def gcs(cls, _patches) -> GCS:
+        """One GCS instance shared by the tests that do not test the initialization."""
+        return GCS("test-project")
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def gcs_with_key(cls, _patches) -> GCS:
+        """One GCS instance created with a service key file, the file only has to exist while it is created."""
+        with patch("pathlib.Path.exists", return_value=True):
+            return GCS("test-project", "/fake/path/to/service_account.json")
+
+    @pytest.fixture
+    def service_key_exists(self, monkeypatch) -> MagicMock:
+        """Make `pathlib.Path.exists` report that the service key file exists, for a single test."""
+        mock_exists = MagicMock(return_value=True)
+        monkeypatch.setattr(Path, "exists", mock_exists)
+        return mock_exists
 
-    def test_gcs_init_without_key(self, mock_gcs_client):
+    @pytest.fixture(autouse=True)
+    def _reset_patches(self):
+        """Clear the recorded calls of the shared patches before each test."""
+        for mock in (
+            self.mock_create_client,
+            self.mock_client,
+            self.mock_bucket,
+        ):
+            mock.reset_mock()
+
+    def test_gcs_init_without_key(self):
         """Test GCS initialization without a service key."""
         project_id = "test-project"
         gcs = GCS(project_id)
-        mock_gcs_client.assert_called_once()
+        self.mock_create_client.assert_called_once()
         assert gcs.project_id == project_id
         assert gcs.service_key is None
 
-    @patch("pathlib.Path.exists")
-    def test_gcs_init_with_key(self, mock_exists, mock_gcs_client):
+    def test_gcs_init_with_key(self, service_key_exists: MagicMock):
         """Test GCS initialization with a service key."""
-
-        # Mock os.path.exists to return True, as if the service_key file exists
-        mock_exists.return_value = True
+        # Path.exists is patched to return True, as if the service_key file exists
         project_id = "test-project"
         service_key = "/fake/path/to/service_account.json"
         gcs = GCS(project_id, service_key)
 
-        mock_gcs_client.assert_called_once()
+        self.mock_create_client.assert_called_once()
         assert gcs.project_id == project_id
         assert gcs.service_key == service_key
-
-    @patch("pathlib.Path.exists")
-    @patch("google.cloud.storage.blob.Blob.upload_from_filename")
-    @patch("unicloud.google_cloud.gcs.GCS.client")
-    def test_upload(self, mock_client, mock_upload, mock_exists):
-        """Test the upload_data method."""
-        mock_exists.return_value = True
-        project_name = "test-project"
-        service_key = "/fake/path/to/service_account.json"
-        gcs = GCS(project_name, service_key)
-
+        service_key_exists.assert_called_once()
+
+    @pytest.mark.parametrize(
+        "operation, blob_method",
+        [("upload", "upload_from_filename"), ("download", "download_to_filename")],
+    )
+    def test_upload_and_download(
+        self, gcs_with_key: GCS, operation: str, blob_method: str
+    ):
+        """Test the upload and download methods, they only differ in the direction of the transfer."""
         # Configure mocks
         bucket_mock = Mock()
-        mock_client.bucket.return_value = bucket_mock
+        self.mock_client.bucket.return_value = bucket_mock
         blob_mock = Mock()
         bucket_mock.blob.return_value = blob_mock
-        blob_mock.upload_from_filename = mock_upload
 
         # Test data
         file_path = "path/to/local/file.txt"
-        destination = "test-bucket/test-object"
+        bucket_path = "test-bucket/test-object"
 
         # Call the method
-        gcs.upload(file_path, destination)
-
-        # Assens
-        mock_client.bucket.assert_called_with("test-bucket")
-        bucket_mock.blob.assert_called_with("test-object")
-        mock_upload.assert_called_with(file_path)
-
-    @patch("pathlib.Path.exists")
-    @patch("google.cloud.storage.blob.Blob.download_to_filename")
-    @patch("unicloud.google_cloud.gcs.GCS.client")
-    def test_download(self, mock_client, mock_download, mock_exists):
-        """Test the download_data method."""
-        mock_exists.return_value = True
-        project_name = "test-project"
-        service_key = "/fake/path/to/service_account.json"
-        gcs = GCS(project_name, service_key)
-
-        # Configure mocks
-        bucket_mock = Mock()
-        mock_client.bucket.return_value = bucket_mock
-        blob_mock = Mock()
-        bucket_mock.blob.return_value = blob_mock
-        blob_mock.download_to_filename = mock_download
-
-        # Test data
-        source = "test-bucket/test-object"
-        file_path = "path/to/downloaded/file.txt"
-
-        # Call the method
-        gcs.download(source, file_path)
+        if operation == "upload":
+            gcs_with_key.upload(file_path, bucket_path)
+        else:
+            gcs_with_key.download(bucket_path, file_path)
 
         # Assertions
-        mock_client.bucket.assert_called_with("test-bucket")
+        self.mock_client.bucket.assert_called_with("test-bucket")
         bucket_mock.blob.assert_called_with("test-object")
-        mock_download.assert_called_with(file_path)
+        getattr(blob_mock, blob_method).assert_called_with(file_path)
 
-    def test__str__(self, mock_gcs_client):
+    def test__str__(self, gcs: GCS):
         """Test the __str__ method."""
-        project_id = "test-project"
-        gcs = GCS(project_id)
         assert isinstance(gcs.__str__(), str)
         assert isinstance(gcs.__repr__(), str)
 
-    @patch("unicloud.google_cloud.gcs.GCS.client")
-    def test_bucket_list(self, gcs_client):
+    @pytest.mark.parametrize("n", [3, 100, 1000])
+    def test_bucket_list(self, gcs: GCS, n: int):
         """
-        The test mocks the GCS.client local property as gcs_client (the GCS.client covers the origial storage.client.Client
+        The test mocks the GCS.client local property as mock_client (the GCS.client covers the origial storage.client.Client
         object from google.cloud.storage.client.Client)
         Inside the test the list_buckets method from the original Client (self.client.list_buckets()) is mocked to
-        return a list of mocked buckets
+        return a list of fake buckets
         `return [bucket.name for bucket in self.client.list_buckets()]`
-        `return [bucket.name for bucket in [mock_bucket1, mock_bucket2, mock_bucket3]]`
         """
-        # Create a mock bucket
-        mock_bucket1 = MagicMock()
-        mock_bucket1.name = "bucket-1"
-        mock_bucket2 = MagicMock()
-        mock_bucket2.name = "bucket-2"
-        mock_bucket3 = MagicMock()
-        mock_bucket3.name = "bucket-3"
-
-        # Mock the list_buckets method
-        gcs_client.list_buckets.return_value = [
-            mock_bucket1,
-            mock_bucket2,
-            mock_bucket3,
-        ]
-
-        gcs = GCS("test-project")
-        gcs_client._client = gcs_client
+        buckets = [SimpleNamespace(name=f"bucket-{i}") for i in range(n)]
+        self.mock_client.list_buckets.return_value = buckets
 
-        assert gcs.bucket_list == ["bucket-1", "bucket-2", "bucket-3"]
-        gcs_client.list_buckets.assert_called_once()
+        assert gcs.bucket_list == [bucket.name for bucket in buckets]
+        self.mock_client.list_buckets.assert_called_once()
 
-    @patch("google.cloud.storage.Bucket")
-    def test_get_bucket(self, mock_bucket):
+    def test_get_bucket(self, gcs: GCS):
         """Test the get_bucket method."""
-        mock_bucket.return_value = MagicMock()
-        project_id = "test-project"
-        gcs = GCS(project_id)
+        self.mock_bucket.return_value = MagicMock()
 
         gcs.get_bucket("test-bucket")
-        mock_bucket.assert_called_once()
-
-
-class TestGCSE2E:
-    project_id = PROJECT_ID
-    bucket_name = MY_TEST_BUCKET
-    gcs = GCS(project_id)
-
-    @classmethod
-    def teardown_class(cls):
-        """Clean up resources after tests."""
-        # Delete the test file from the bucket
-        # cls.gcs.delete_data(f"{cls.bucket_name}/{cls.test_file_name}")
-        pass
-
-    def test_upload_and_download(self, test_file: Path, test_file_content: str):
-        """Test uploading and downloading a file to/from GCS."""
-        bucket_path = f"{self.bucket_name}/{test_file.name}"
-        self.gcs.upload(str(test_file), bucket_path)
+        self.mock_bucket.assert_called_once()
+
+
+@pytest.mark.mock
+class TestCreateClientMock:
+
+    def test_client_uses_pooled_authorized_session(self, monkeypatch):
+        """The client shares one authorized session with a connection pool of HTTP_POOL_SIZE."""
+        monkeypatch.setenv(
+            "GOOGLE_APPLICATION_CREDENTIALS", "/fake/service_account.json"
+        )
+        monkeypatch.setattr(
+            "google.oauth2.service_account.Credentials.from_service_account_file",
+            lambda path: AnonymousCredentials(),
+        )
+        client = GCS("test-project").client
+
+        assert isinstance(client._http, AuthorizedSession)
+        adapter = client._http.get_adapter("https://storage.googleapis.com")
+        assert adapter._pool_maxsize == HTTP_POOL_SIZE
+        assert client.project == "test-project"
+
+    def test_session_credentials_are_scoped(self, monkeypatch):
+        """The authorized session requests its token with the storage scopes, an unscoped grant is rejected."""
+        credentials = service_account.Credentials(
+            signer=MagicMock(),
+            service_account_email="unicloud@test-project.iam.gserviceaccount.com",
+            token_uri="https://oauth2.googleapis.com/token",
+        )
+        monkeypatch.setenv(
+            "GOOGLE_APPLICATION_CREDENTIALS", "/fake/service_account.json"
+        )
+        monkeypatch.setattr(
+            "google.oauth2.service_account.Credentials.from_service_account_file",
+            lambda path: credentials,
+        )
+        client = GCS("test-project").client
+
+        assert tuple(client._http.credentials.scopes) == storage.Client.SCOPE
+        assert not client._http.credentials.requires_scopes
+
+    def test_get_bucket_keeps_client_connection_pool(self, monkeypatch):
+        """Buckets share the pool of the client instead of mounting their own."""
+        monkeypatch.setenv(
+            "GOOGLE_APPLICATION_CREDENTIALS", "/fake/service_account.json"
+        )
+        monkeypatch.setattr(
+            "google.oauth2.service_account.Credentials.from_service_account_file",
+            lambda path: AnonymousCredentials(),
+        )
+        gcs = GCS("test-project")
+        adapter = gcs.client._http.get_adapter("https://storage.googleapis.com")
 
-        download_path = f"downloaded-{test_file.name}"
-        self.gcs.download(bucket_path, download_path)
+        gcs.get_bucket("bucket-1")
+        gcs.get_bucket("bucket-2")
 
-        # Verify the content of the downloaded file
-        with open(download_path, "r") as f:
-            downloaded_content = f.read()
+        assert gcs.client._http.get_adapter("https://storage.googleapis.com") is adapter
+        assert adapter._pool_maxsize == HTTP_POOL_SIZE
 
-        assert downloaded_content == test_file_content
 
-        os.remove(download_path)
+@pytest.mark.e2e
+@pytest.mark.xdist_group(name="gcs_e2e")
+class TestGCSE2E:
 
-    def test_get_bucket(self):
-        bucket = self.gcs.get_bucket(self.bucket_name)
+    def test_upload(
+        self,
+        gcs_client: GCS,
+        gcs_bucket_name: str,
+        test_file: Path,
+        test_file_content: str,
+    ):
+        """Test uploading a file to GCS, the uploaded content is read back in memory."""
+        bucket_path = f"{gcs_bucket_name}/{test_file.name}"
+        gcs_client.upload(str(test_file), bucket_path)
+
+        blob = gcs_client.client.bucket(gcs_bucket_name).blob(test_file.name)
+        assert blob.download_as_bytes().decode() == test_file_content
+
+    def test_get_bucket(self, gcs_client: GCS, gcs_bucket_name: str):
+        bucket = gcs_client.get_bucket(gcs_bucket_name)
         assert isinstance(bucket, Bucket)
@@ -1,141 +1,225 @@
+import base64
 import fnmatch
+import gzip
+import logging
 import os
-import shutil
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
-from unittest.mock import MagicMock, call, patch
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+from unittest.mock import MagicMock, call
 
+import google_crc32c
 import pytest
+import requests
+from google.api_core.exceptions import NotFound, PreconditionFailed
 from google.cloud import storage
+from google.cloud.storage import transfer_manager
+from requests.adapters import HTTPAdapter
 
-from unicloud.google_cloud.gcs import GCS, Bucket
+from unicloud.google_cloud import gcs
+from unicloud.google_cloud.gcs import Bucket
 
-MY_TEST_BUCKET = "testing-repositories"
-PROJECT_ID = "earth-engine-415620"
 
+def _parallel(func: Callable, items: Iterable, workers: int = 16) -> List[Any]:
+    """Call `func` on each item concurrently, for independent requests that only wait on the network."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
 
+
+@pytest.mark.e2e
+@pytest.mark.xdist_group(name="gcs_bucket_e2e")
 class TestGCSBucketE2E:
 
-    @classmethod
-    def setup_class(cls):
-        """Set up resources before running tests."""
-        client = GCS(PROJECT_ID).client
-        bucket = storage.Bucket(client, MY_TEST_BUCKET, user_project=PROJECT_ID)
-        cls.bucket = Bucket(bucket)
+    @pytest.fixture(scope="class")
+    def cached_blob_names(self, gcs_bucket: Bucket) -> List[str]:
+        """List the bucket once and share the listing between the read-only tests."""
+        return gcs_bucket.list_files()
 
-    def test_list_files(self):
-        blobs = self.bucket.list_files()
+    def test_list_files(self, gcs_bucket: Bucket, cached_blob_names: List[str]):
+        blobs = cached_blob_names
         assert isinstance(blobs, list)
-        assert all([isinstance(blob, str) for blob in blobs])
+        assert all(isinstance(blob, str) for blob in blobs)
 
-    def test_get_file(self):
-        blobs = self.bucket.list_files()
-        blob = self.bucket.get_file(blobs[0])
+    def test_get_file(self, gcs_bucket: Bucket, cached_blob_names: List[str]):
+        blob = gcs_bucket.get_file(cached_blob_names[0])
         assert isinstance(blob, storage.blob.Blob)
 
-    def test_file_exists(self):
-        assert self.bucket.file_exists("211102_rabo_all_aois.geojson")
-        assert not self.bucket.file_exists("non_existent_file.geojson")
+    def test_file_exists(self, gcs_bucket: Bucket):
+        assert gcs_bucket.file_exists("211102_rabo_all_aois.geojson")
+        assert not gcs_bucket.file_exists("non_existent_file.geojson")
+        files = gcs_bucket.iter_files(
+            prefix="211102_rabo_all_aois.geojson", max_results=1
+        )
+        assert next(files, None) == "211102_rabo_all_aois.geojson"
 
-    def test_upload_file(self, test_file: Path):
+    def test_upload_file(self, gcs_bucket: Bucket, test_file: Path):
         """
         Test uploading a single file to the bucket.
         """
         bucket_path = f"test-upload-gcs-bucket-{test_file.name}"
-        self.bucket.upload(test_file, bucket_path)
-        assert any(blob.name == bucket_path for blob in self.bucket.bucket.list_blobs())
-        self.bucket.delete(bucket_path)
+        blob = gcs_bucket.upload(test_file, bucket_path)
+        # the upload response carries the generation of the new object, no listing is needed.
+        assert blob.name == bucket_path
+        assert blob.generation is not None
+        gcs_bucket.delete(bucket_path)
+
+    def test_upload_bytes(self, gcs_bucket: Bucket, test_file_content: str):
+        bucket_path = "test-upload-gcs-bucket-bytes.txt"
+        gcs_bucket.upload(test_file_content.encode(), bucket_path, overwrite=True)
+        blob = gcs_bucket.get_file(bucket_path)
+        assert blob.download_as_bytes() == test_file_content.encode()
+        gcs_bucket.delete(bucket_path)
 
     def test_upload_directory_with_subdirectories_e2e(
-        self, upload_test_data: Dict[str, Path]
+        self, gcs_bucket: Bucket, upload_test_data: Dict[str, Path]
     ):
         local_dir = upload_test_data["local_dir"]
         bucket_path = upload_test_data["bucket_path"]
 
-        self.bucket.upload(local_dir, bucket_path)
+        gcs_bucket.upload(local_dir, bucket_path)
 
-        uploaded_files = [blob.name for blob in self.bucket.bucket.list_blobs()]
+        uploaded_files = set(gcs_bucket.iter_files(prefix=f"{bucket_path}/"))
         expected_files = upload_test_data["expected_files"]
-        assert set(uploaded_files) & expected_files == expected_files
+        assert expected_files <= uploaded_files
 
         # Cleanup
-        for blob_name in list(expected_files):
-            self.bucket.bucket.blob(blob_name).delete()
-
-    @pytest.mark.e2e
-    def test_download_single_file(self):
-        blobs = self.bucket.list_files()
-        blob = self.bucket.get_file(blobs[0])
-        download_path = f"tests/delete-downloaded-{blob.name}"
-        self.bucket.download(blob.name, download_path, overwrite=True)
-        assert os.path.exists(download_path)
-        os.remove(download_path)
+        _parallel(lambda name: gcs_bucket.bucket.blob(name).delete(), expected_files)
 
-    @pytest.mark.e2e
-    def test_download_directory(self):
-        dir_files = ["subdir", "test-file-1.txt", "test-file-2.txt"]
-        download_path = "tests/data/root3"
-        self.bucket.download("root3/", download_path, overwrite=True)
+    def test_download_single_file(
+        self, gcs_bucket: Bucket, cached_blob_names: List[str], tmp_path: Path
+    ):
+        blob = gcs_bucket.get_file(cached_blob_names[0])
+        download_path = tmp_path / Path(blob.name).name
+        gcs_bucket.download(blob.name, download_path, overwrite=True)
+        assert download_path.exists()
+
+    def test_download_directory(self, gcs_bucket: Bucket, tmp_path: Path):
+        dir_files = {"subdir", "test-file-1.txt", "test-file-2.txt"}
+        download_path = tmp_path / "root3"
+        gcs_bucket.download("root3/", download_path, overwrite=True)
         assert os.path.exists(download_path)
-        assert all(elem in os.listdir(download_path) for elem in dir_files)
-        assert os.listdir(f"{download_path}/subdir") == ["test-file-3.txt"]
-        shutil.rmtree(download_path)
+        assert dir_files <= set(os.listdir(download_path))
+        assert set(os.listdir(download_path / "subdir")) == {"test-file-3.txt"}
+
+    def test_bulk_upload_and_download(self, gcs_bucket: Bucket, tmp_path: Path):
+        """Transfer many small files in one call each way, so the requests overlap instead of running one by one."""
+        source_dir = tmp_path / "upload"
+        source_dir.mkdir()
+        file_names = [f"file-{i}.txt" for i in range(20)]
+        _parallel(lambda name: (source_dir / name).write_text(name), file_names)
+        prefix = "test-bulk-transfer/"
+
+        transfer_manager.upload_many_from_filenames(
+            gcs_bucket.bucket,
+            file_names,
+            source_directory=str(source_dir),
+            blob_name_prefix=prefix,
+            max_workers=8,
+            worker_type=transfer_manager.THREAD,
+            raise_exception=True,
+        )
+
+        download_dir = tmp_path / "download"
+        transfer_manager.download_many_to_path(
+            gcs_bucket.bucket,
+            file_names,
+            destination_directory=str(download_dir),
+            blob_name_prefix=prefix,
+            max_workers=8,
+            worker_type=transfer_manager.THREAD,
+            raise_exception=True,
+        )
+        for file_name in file_names:
+            assert (download_dir / file_name).read_text() == file_name
 
-    def test_delete_file(self, test_file):
-        self.bucket.upload(str(test_file), str(test_file))
-        self.bucket.delete(str(test_file))
-        assert str(test_file) not in self.bucket.list_files()
+        gcs_bucket.delete(prefix)
 
-    def test_rename_file(self, test_file: Path):
+    def test_delete_file(self, gcs_bucket: Bucket, test_file):
+        gcs_bucket.upload(str(test_file), str(test_file))
+        gcs_bucket.delete(str(test_file))
+        assert not gcs_bucket.file_exists(str(test_file))
+
+    def test_rename_file(self, gcs_bucket: Bucket, test_file: Path):
         """
         Test renaming a single file in the bucket.
         """
         old_name = "test-rename-old-file.txt"
         new_name = "test-rename-new-file.txt"
-        self.bucket.upload(test_file, old_name, overwrite=True)
+        gcs_bucket.upload(test_file, old_name, overwrite=True)
 
-        self.bucket.rename(old_name, new_name)
+        renamed = gcs_bucket.rename(old_name, new_name)
 
-        # Verify the new file exists and the old file does not
-        assert self.bucket.file_exists(new_name)
-        assert not self.bucket.file_exists(old_name)
-        self.bucket.delete(new_name)
+        assert renamed == [new_name]
+        gcs_bucket.delete(new_name)
 
-    def test_rename_directory(self, upload_test_data: Dict[str, Path]):
+    def test_rename_directory(
+        self, gcs_bucket: Bucket, upload_test_data: Dict[str, Path]
+    ):
         """
         Test renaming a directory in the bucket.
         """
         old_dir = "old_directory/"
         new_dir = "new_directory/"
         local_dir = upload_test_data["local_dir"]
-        self.bucket.upload(local_dir, old_dir, overwrite=True)
+        gcs_bucket.upload(local_dir, old_dir, overwrite=True)
 
         # Rename the directory
-        self.bucket.rename(old_dir, new_dir)
+        renamed = gcs_bucket.rename(old_dir, new_dir)
+
+        # Verify all the files were renamed under the new directory
+        expected_files = frozenset(
+            file.replace("upload-dir", "new_directory")
+            for file in upload_test_data["expected_files"]
+        )
+        assert set(renamed) == expected_files
+        # a single listing confirms that nothing is left under the old directory
+        assert next(gcs_bucket.iter_files(prefix=old_dir), None) is None
+
+        gcs_bucket.delete(new_dir)
+
 
-        # Verify files under the new directory exist and old directory does not
-        for file in upload_test_data["expected_files"]:
-            new_file = file.replace("upload-dir", "new_directory")
-            assert self.bucket.file_exists(new_file)
-            assert not self.bucket.file_exists(file)
+@pytest.fixture(scope="class")
+def mock_scaffold() -> MagicMock:
+    """Mock bucket built once per test class."""
+    return MagicMock()
 
-        self.bucket.delete(new_dir)
+
+@pytest.fixture
+def mocks(mock_scaffold: MagicMock) -> Tuple[MagicMock, List[MagicMock]]:
+    """Reset the class mock bucket and give each test fresh blobs.
+
+    The tests set plain attributes on the blobs (`name`, `size`, ...), which `reset_mock` would keep.
+    """
+    mock_scaffold.reset_mock(return_value=True, side_effect=True)
+    blobs = [MagicMock(spec=storage.Blob) for _ in range(4)]
+    return mock_scaffold, blobs
+
+
+@pytest.fixture
+def fake_blobs() -> List[SimpleNamespace]:
+    """Blobs of a `data/` directory, for the tests that only use the name and the delete/download methods."""
+    return [
+        SimpleNamespace(name=name, delete=MagicMock(), download_to_filename=MagicMock())
+        for name in ("data/file1.txt", "data/subdir/file2.txt", "data/subdir/file3.txt")
+    ]
 
 
 @pytest.mark.mock
+@pytest.mark.xdist_group(name="gcs_list_files_mock")
 class TestListFilesMock:
 
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, mocks: Tuple[MagicMock, List[MagicMock]]):
         # Mock bucket and blobs
-        self.mock_bucket = MagicMock()
-        self.mock_blob1 = MagicMock()
+        self.mock_bucket, blobs = mocks
+        self.mock_blob1, self.mock_blob2, self.mock_blob3, self.mock_blob4 = blobs
         self.mock_blob1.name = "file1.txt"
-        self.mock_blob2 = MagicMock()
         self.mock_blob2.name = "data/file2.csv"
-        self.mock_blob3 = MagicMock()
         self.mock_blob3.name = "data/file3.log"
-        self.mock_blob4 = MagicMock()
         self.mock_blob4.name = "logs/log1.txt"
 
         self.mock_bucket.list_blobs.return_value = [
@@ -157,22 +241,24 @@ class TestListFilesMock:
             "logs/log1.txt",
         ]
         self.mock_bucket.list_blobs.assert_called_once_with(
-            prefix=None, max_results=None
+            prefix=None, max_results=None, match_glob=None, fields=gcs.LIST_FIELDS
         )
 
     def test_list_files_with_prefix(self):
         """Test listing files with a prefix."""
-        self.mock_bucket.list_blobs.side_effect = lambda prefix, max_results: [
-            blob
-            for blob in [self.mock_blob2, self.mock_blob3]
-            if blob.name.startswith(prefix)
-        ]
+        self.mock_bucket.list_blobs.side_effect = (
+            lambda prefix, max_results, match_glob, fields: [
+                blob
+                for blob in [self.mock_blob2, self.mock_blob3]
+                if blob.name.startswith(prefix)
+            ]
+        )
 
         # List files with prefix
         files = self.gcs_bucket.list_files(prefix="data/")
         assert files == ["data/file2.csv", "data/file3.log"]
         self.mock_bucket.list_blobs.assert_called_once_with(
-            prefix="data/", max_results=None
+            prefix="data/", max_results=None, match_glob=None, fields=gcs.LIST_FIELDS
         )
 
     def test_list_files_with_pattern(self):
@@ -184,14 +270,35 @@ class TestListFilesMock:
             if fnmatch.fnmatch(blob.name, "*.txt")
         ]
         assert files == expected_files
+        self.mock_bucket.list_blobs.assert_called_once_with(
+            prefix=None, max_results=None, match_glob="**.txt", fields=gcs.LIST_FIELDS
+        )
+
+    def test_iter_files_is_lazy(self):
+        """Test that iter_files yields the names without consuming the whole listing."""
+        blobs = iter(self.mock_bucket.list_blobs.return_value)
+        self.mock_bucket.list_blobs.return_value = blobs
+        files = self.gcs_bucket.iter_files()
+        assert next(files) == "file1.txt"
+        assert next(blobs).name == "data/file2.csv"
+
+    def test_list_files_with_complex_pattern(self):
+        """Test that patterns without a GCS glob equivalent are only matched locally."""
+        files = self.gcs_bucket.list_files(pattern="data/file?.*", max_results=1)
+        assert files == ["data/file2.csv"]
+        self.mock_bucket.list_blobs.assert_called_once_with(
+            prefix=None, max_results=None, match_glob=None, fields=gcs.LIST_FIELDS
+        )
 
     def test_list_files_with_prefix_and_pattern(self):
         """Test listing files with a prefix and pattern."""
-        self.mock_bucket.list_blobs.side_effect = lambda prefix, max_results: [
-            blob
-            for blob in [self.mock_blob2, self.mock_blob3]
-            if blob.name.startswith(prefix)
-        ]
+        self.mock_bucket.list_blobs.side_effect = (
+            lambda prefix, max_results, match_glob, fields: [
+                blob
+                for blob in [self.mock_blob2, self.mock_blob3]
+                if blob.name.startswith(prefix)
+            ]
+        )
 
         # List files with prefix and pattern
         files = self.gcs_bucket.list_files(prefix="data/", pattern="*.csv")
@@ -204,23 +311,29 @@ class TestListFilesMock:
 
     def test_list_files_with_max_results(self):
         """Test listing files with a maximum number of results."""
-        self.mock_bucket.list_blobs.side_effect = lambda prefix, max_results: [
-            self.mock_blob1,
-            self.mock_blob2,
-        ][:max_results]
+        self.mock_bucket.list_blobs.side_effect = (
+            lambda prefix, max_results, match_glob, fields: [
+                self.mock_blob1,
+                self.mock_blob2,
+            ][:max_results]
+        )
 
         # List files with max results
         files = self.gcs_bucket.list_files(max_results=2)
         assert files == ["file1.txt", "data/file2.csv"]
-        self.mock_bucket.list_blobs.assert_called_once_with(prefix=None, max_results=2)
+        self.mock_bucket.list_blobs.assert_called_once_with(
+            prefix=None, max_results=2, match_glob=None, fields=gcs.LIST_FIELDS
+        )
 
     def test_list_files_with_all_filters(self):
         """Test listing files with all filters."""
-        self.mock_bucket.list_blobs.side_effect = lambda prefix, max_results: [
-            blob
-            for blob in [self.mock_blob2, self.mock_blob3]
-            if blob.name.startswith(prefix)
-        ][:max_results]
+        self.mock_bucket.list_blobs.side_effect = (
+            lambda prefix, max_results, match_glob, fields: [
+                blob
+                for blob in [self.mock_blob2, self.mock_blob3]
+                if blob.name.startswith(prefix)
+            ][:max_results]
+        )
 
         # List files with prefix, pattern, and max results
         files = self.gcs_bucket.list_files(
@@ -234,15 +347,13 @@ class TestListFilesMock:
         assert files == expected_files
 
 
+@pytest.mark.e2e
+@pytest.mark.xdist_group(name="gcs_delete_e2e")
 class TestDeleteE2E:
     """
     End-to-End tests for the Bucket class delete method.
     """
 
-    @pytest.fixture
-    def gcs_bucket(self) -> Bucket:
-        return GCS(PROJECT_ID).get_bucket(MY_TEST_BUCKET)
-
     def test_delete_single_file_e2e(self, gcs_bucket: Bucket):
 
         blob = gcs_bucket.bucket.blob("test_delete_single.txt")
@@ -253,21 +364,20 @@ class TestDeleteE2E:
         assert not gcs_bucket.file_exists("test_delete_single.txt")
 
     def test_delete_directory_e2e(self, gcs_bucket: Bucket):
-
-        blob1 = gcs_bucket.bucket.blob("test_directory/file1.txt")
-        blob1.upload_from_string("File 1 content")
-        blob2 = gcs_bucket.bucket.blob("test_directory/subdir/file2.txt")
-        blob2.upload_from_string("File 2 content")
-
-        assert gcs_bucket.file_exists("test_directory/file1.txt")
-        assert gcs_bucket.file_exists("test_directory/subdir/file2.txt")
+        file_names = [f"test_directory/file{i}.txt" for i in range(8)] + [
+            f"test_directory/subdir/file{i}.txt" for i in range(8)
+        ]
+        _parallel(
+            lambda name: gcs_bucket.upload(name.encode(), name, overwrite=True),
+            file_names,
+        )
+        assert all(_parallel(gcs_bucket.file_exists, file_names))
 
         # Delete the directory
         gcs_bucket.delete("test_directory/")
 
         # Verify files are deleted
-        assert not gcs_bucket.file_exists("test_directory/file1.txt")
-        assert not gcs_bucket.file_exists("test_directory/subdir/file2.txt")
+        assert not any(_parallel(gcs_bucket.file_exists, file_names))
 
     def test_delete_nonexistent_file_e2e(self, gcs_bucket: Bucket):
         """Test deleting a file that does not exist."""
@@ -301,31 +411,184 @@ class TestPropertiesMock:
     def test__repr__(self):
         assert str(self.gcs_bucket.__repr__()) == "Bucket: test_bucket"
 
+    def test_workers_resize_connection_pool(self):
+        session = requests.Session()
+        Bucket(SimpleNamespace(client=SimpleNamespace(_http=session)), workers=32)
+
+        adapter = session.get_adapter("https://storage.googleapis.com")
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_maxsize == 32
+
+    def test_workers_keep_default_connection_pool(self):
+        session = requests.Session()
+        adapter = session.get_adapter("https://storage.googleapis.com")
+
+        Bucket(SimpleNamespace(client=SimpleNamespace(_http=session)), workers=8)
+
+        assert session.get_adapter("https://storage.googleapis.com") is adapter
+
+    @pytest.mark.parametrize(
+        "client",
+        [None, SimpleNamespace(), SimpleNamespace(_http=MagicMock())],
+        ids=["no-client", "no-http", "custom-transport"],
+    )
+    def test_workers_skip_pool_without_session(self, client):
+        gcs_bucket = Bucket(SimpleNamespace(client=client, name="test_bucket"))
+
+        assert gcs_bucket.name == "test_bucket"
+        if client is not None and hasattr(client, "_http"):
+            client._http.mount.assert_not_called()
+
+    def test_workers_keep_larger_connection_pool(self):
+        session = requests.Session()
+        Bucket(SimpleNamespace(client=SimpleNamespace(_http=session)), workers=32)
+        adapter = session.get_adapter("https://storage.googleapis.com")
+
+        Bucket(SimpleNamespace(client=SimpleNamespace(_http=session)), workers=8)
+
+        assert session.get_adapter("https://storage.googleapis.com") is adapter
+        assert adapter._pool_maxsize == 32
+
+    def test_concurrent_requests_do_not_contend_for_connections(self, caplog):
+        """All the workers can hold a connection at the same time, none is discarded when they are returned."""
+        session = requests.Session()
+        Bucket(SimpleNamespace(client=SimpleNamespace(_http=session)), workers=32)
+        adapter = session.get_adapter("https://storage.googleapis.com")
+        pool = adapter.poolmanager.connection_from_url("https://storage.googleapis.com")
 
+        connections = [pool._get_conn() for _ in range(32)]
+        with caplog.at_level(logging.WARNING, logger="urllib3.connectionpool"):
+            for connection in connections:
+                pool._put_conn(connection)
+
+        assert pool.pool.qsize() == 32
+        assert "Connection pool is full" not in caplog.text
+
+
+@pytest.mark.mock
+class TestFileExistsMock:
+
+    def setup_method(self):
+        self.mock_bucket = MagicMock()
+        self.gcs_bucket = Bucket(self.mock_bucket)
+
+    @pytest.mark.parametrize("exists", [True, False])
+    def test_file_exists(self, exists: bool):
+        mock_blob = self.mock_bucket.blob.return_value
+        mock_blob.exists.return_value = exists
+
+        assert self.gcs_bucket.file_exists("file.txt") is exists
+
+        self.mock_bucket.blob.assert_called_once_with("file.txt")
+        mock_blob.exists.assert_called_once_with(self.mock_bucket.client)
+        self.mock_bucket.list_blobs.assert_not_called()
+        self.mock_bucket.get_blob.assert_not_called()
+
+
+@pytest.mark.mock
+class TestCacheMock:
+
+    def setup_method(self):
+        self.mock_bucket = MagicMock()
+        self.mock_blob = self.mock_bucket.blob.return_value
+        self.mock_blob.exists.return_value = True
+        self.gcs_bucket = Bucket(self.mock_bucket, cache_ttl=60)
+
+    def test_file_exists_cached(self):
+        assert self.gcs_bucket.file_exists("file.txt")
+        assert self.gcs_bucket.file_exists("file.txt")
+        self.mock_blob.exists.assert_called_once()
+
+    def test_cache_disabled_by_default(self):
+        gcs_bucket = Bucket(self.mock_bucket)
+        gcs_bucket.file_exists("file.txt")
+        gcs_bucket.file_exists("file.txt")
+        assert self.mock_blob.exists.call_count == 2
+
+    def test_cache_expires(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(gcs.time, "monotonic", lambda: now[0])
+        self.gcs_bucket.file_exists("file.txt")
+        now[0] = 61.0
+        self.gcs_bucket.file_exists("file.txt")
+        assert self.mock_blob.exists.call_count == 2
+
+    def test_negative_cache(self, tmp_path: Path):
+        gcs_bucket = Bucket(self.mock_bucket, negative_cache_ttl=2)
+        self.mock_blob.exists.return_value = False
+        assert not gcs_bucket.file_exists("file.txt")
+        assert not gcs_bucket.file_exists("file.txt")
+        self.mock_blob.exists.assert_called_once()
+
+        local_file = tmp_path / "file.txt"
+        local_file.write_text("content")
+        gcs_bucket.upload(local_file, "file.txt", overwrite=True)
+        self.mock_blob.exists.return_value = True
+        assert gcs_bucket.file_exists("file.txt")
+        assert gcs_bucket.file_exists("file.txt")
+        # positive results are not cached without `cache_ttl`
+        assert self.mock_blob.exists.call_count == 3
+
+    def test_delete_invalidates_cache(self):
+        blob = MagicMock()
+        blob.name = "data/file.txt"
+        self.mock_bucket.list_blobs.return_value = [blob]
+
+        assert self.gcs_bucket.list_files(prefix="data/") == ["data/file.txt"]
+        assert self.gcs_bucket.file_exists("data/file.txt")
+        self.gcs_bucket.delete("data/")
+        self.mock_bucket.list_blobs.return_value = []
+
+        assert self.gcs_bucket.list_files(prefix="data/") == []
+        self.mock_blob.exists.return_value = False
+        assert not self.gcs_bucket.file_exists("data/file.txt")
+
+    def test_upload_invalidates_listing(self, tmp_path: Path):
+        local_file = tmp_path / "file.txt"
+        local_file.write_text("content")
+        self.mock_bucket.list_blobs.return_value = []
+        self.gcs_bucket.list_files(prefix="data/")
+        self.gcs_bucket.list_files(prefix="other/")
+
+        self.gcs_bucket.upload(local_file, "data/file.txt", overwrite=True)
+        self.gcs_bucket.list_files(prefix="data/")
+        self.gcs_bucket.list_files(prefix="other/")
+
+        prefixes = [
+            c.kwargs["prefix"] for c in self.mock_bucket.list_blobs.call_args_list
+        ]
+        assert prefixes == ["data/", "other/", "data/"]
+
+    def test_list_files_cached(self):
+        self.mock_bucket.list_blobs.return_value = []
+        self.gcs_bucket.list_files(prefix="data/")
+        self.gcs_bucket.list_files(prefix="data/")
+        self.mock_bucket.list_blobs.assert_called_once()
+
+        self.gcs_bucket.list_files(prefix="data/", use_cache=False)
+        assert self.mock_bucket.list_blobs.call_count == 2
+
+
+@pytest.mark.xdist_group(name="gcs_download_mock")
 class TestDownloadMock:
 
     @pytest.mark.mock
-    def test_download_directory_from_gcs(self):
-
-        mock_bucket = MagicMock()
-        mock_blob1 = MagicMock()
-        mock_blob1.name = "test_dir/file1.txt"
-        mock_blob2 = MagicMock()
-        mock_blob2.name = "test_dir/subdir/file2.txt"
-        mock_blob3 = MagicMock()
-        mock_blob3.name = "test_dir/subdir/file3.txt"
+    def test_download_directory_from_gcs(
+        self, mocks, fake_blobs: List[SimpleNamespace], tmp_path: Path
+    ):
 
-        mock_bucket.list_blobs.return_value = [mock_blob1, mock_blob2, mock_blob3]
+        mock_bucket, _ = mocks
+        mock_blob1, mock_blob2, mock_blob3 = fake_blobs
+        mock_bucket.list_blobs.return_value = fake_blobs
 
         gcs_bucket = Bucket(mock_bucket)
 
-        mock_blob1.download_to_filename = MagicMock()
-        mock_blob2.download_to_filename = MagicMock()
-        mock_blob3.download_to_filename = MagicMock()
-
-        local_path = Path("tests/data/local_test_dir")
-        gcs_bucket.download("test_dir/", local_path)
+        local_path = tmp_path / "local_test_dir"
+        gcs_bucket.download("data/", local_path)
 
+        mock_bucket.list_blobs.assert_called_once_with(
+            prefix="data/", fields=gcs.DOWNLOAD_LIST_FIELDS
+        )
         mock_blob1.download_to_filename.assert_called_once_with(
             local_path / "file1.txt"
         )
@@ -338,33 +601,143 @@ class TestDownloadMock:
 
         assert (local_path / "subdir").exists()
 
-        shutil.rmtree(local_path)
-
     @pytest.mark.mock
-    def test_download_single_file_from_gcs(self):
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+    def test_download_single_file_from_gcs(self, mocks, tmp_path: Path):
+        mock_bucket, (mock_blob, *_) = mocks
         mock_blob.name = "test_file.txt"
+        mock_blob.size = 1024
+        mock_blob.content_encoding = None
         mock_bucket.blob.return_value = mock_blob
 
         gcs_bucket = Bucket(mock_bucket)
 
-        mock_blob.download_to_filename = MagicMock()
-
         file_name = "test_file.txt"
-        local_path = Path("local_test_file.txt")
+        local_path = tmp_path / "local_test_file.txt"
         gcs_bucket.download(file_name, str(local_path))
 
         mock_bucket.blob.assert_called_once_with(file_name)
+        mock_blob.reload.assert_called_once()
         mock_blob.download_to_filename.assert_called_once_with(str(local_path))
 
+    @pytest.mark.mock
+    def test_download_directory_existing_file_raises(self, mocks, tmp_path: Path):
+        mock_bucket, (mock_blob1, mock_blob2, *_) = mocks
+        mock_blob1.name = "test_dir/file1.txt"
+        mock_blob2.name = "test_dir/file2.txt"
+        mock_bucket.list_blobs.return_value = [mock_blob1, mock_blob2]
+        (tmp_path / "file2.txt").write_text("existing")
+
+        with pytest.raises(ValueError, match="already exists"):
+            Bucket(mock_bucket).download("test_dir/", tmp_path)
+
+        mock_blob1.download_to_filename.assert_not_called()
+        mock_blob2.download_to_filename.assert_not_called()
+
+
+class TestDownloadParallelMock:
+
+    def setup_method(self):
+        self.content = b"0123456789"
+        self.mock_bucket = MagicMock()
+        self.mock_blob = MagicMock()
+        self.mock_blob.size = len(self.content)
+        self.mock_blob.content_encoding = None
+        self.mock_blob.crc32c = base64.b64encode(
+            google_crc32c.Checksum(self.content).digest()
+        ).decode("utf-8")
+        self.mock_blob.download_to_file.side_effect = (
+            lambda f, start, end, checksum: f.write(self.content[start : end + 1])
+        )
+        self.mock_bucket.get_blob.return_value = self.mock_blob
+        self.gcs_bucket = Bucket(self.mock_bucket)
+
+    @pytest.mark.mock
+    def test_download_in_chunks(self, tmp_path: Path):
+        local_path = tmp_path / "large-file.bin"
+        self.gcs_bucket.download_parallel(
+            "large-file.bin", local_path, chunk_size=4, workers=2
+        )
 
+        assert local_path.read_bytes() == self.content
+        self.mock_bucket.get_blob.assert_called_once_with("large-file.bin")
+        ranges = sorted(
+            (c.kwargs["start"], c.kwargs["end"])
+            for c in self.mock_blob.download_to_file.call_args_list
+        )
+        assert ranges == [(0, 3), (4, 7), (8, 9)]
+        self.mock_blob.download_to_filename.assert_not_called()
+
+    @pytest.mark.mock
+    def test_download_checksum_mismatch_deletes_file(self, tmp_path: Path):
+        self.mock_blob.crc32c = base64.b64encode(
+            google_crc32c.Checksum(b"corrupted").digest()
+        ).decode("utf-8")
+        local_path = tmp_path / "large-file.bin"
+
+        with pytest.raises(ValueError, match="crc32c"):
+            self.gcs_bucket.download_parallel(
+                "large-file.bin", local_path, chunk_size=4, workers=2
+            )
+        assert not local_path.exists()
+
+    @pytest.mark.mock
+    def test_download_small_file(self, tmp_path: Path):
+        local_path = tmp_path / "small-file.bin"
+        self.gcs_bucket.download_parallel("small-file.bin", local_path)
+
+        self.mock_blob.download_to_filename.assert_called_once_with(str(local_path))
+        self.mock_blob.download_to_file.assert_not_called()
+
+    @pytest.mark.mock
+    def test_download_missing_file(self, tmp_path: Path):
+        self.mock_bucket.get_blob.return_value = None
+        with pytest.raises(FileNotFoundError):
+            self.gcs_bucket.download_parallel("missing.bin", tmp_path / "missing.bin")
+
+    @pytest.mark.mock
+    def test_download_large_file_in_chunks(self, monkeypatch, tmp_path: Path):
+        monkeypatch.setattr(gcs, "DOWNLOAD_CHUNK_SIZE", 4)
+        self.mock_bucket.blob.return_value = self.mock_blob
+        local_path = tmp_path / "large-file.bin"
+
+        self.gcs_bucket.download("large-file.bin", local_path)
+
+        assert local_path.read_bytes() == self.content
+        self.mock_blob.reload.assert_called_once()
+        assert self.mock_blob.download_to_file.call_count == 3
+        self.mock_blob.download_to_filename.assert_not_called()
+
+    @pytest.mark.mock
+    def test_download_file_not_found(self, tmp_path: Path):
+        self.mock_bucket.blob.return_value = self.mock_blob
+        self.mock_blob.reload.side_effect = NotFound("missing.bin")
+
+        with pytest.raises(FileNotFoundError):
+            self.gcs_bucket.download("missing.bin", tmp_path / "missing.bin")
+
+
+@pytest.fixture
+def fake_path(monkeypatch) -> SimpleNamespace:
+    """Patch the filesystem checks of `pathlib.Path` once, the tests configure the mocks they need."""
+    path_mocks = SimpleNamespace(
+        exists=MagicMock(return_value=True),
+        is_file=MagicMock(return_value=True),
+        is_dir=MagicMock(return_value=False),
+        iterdir=MagicMock(return_value=[]),
+        rglob=MagicMock(return_value=[]),
+        stat=MagicMock(return_value=SimpleNamespace(st_size=1024)),
+    )
+    for name, mock in vars(path_mocks).items():
+        monkeypatch.setattr(Path, name, mock)
+    return path_mocks
+
+
+@pytest.mark.xdist_group(name="gcs_upload_mock")
 class TestUploadMock:
 
-    def test_upload_single_file(self):
+    def test_upload_single_file(self, mocks, fake_path: SimpleNamespace):
 
-        mock_blob = MagicMock()
-        mock_bucket = MagicMock()
+        mock_bucket, (mock_blob, *_) = mocks
         mock_bucket.blob.return_value = mock_blob
 
         gcs_bucket = Bucket(mock_bucket)
@@ -372,17 +745,85 @@ class TestUploadMock:
         local_file = Path("local/file.txt")
         bucket_path = "bucket/folder/file.txt"
 
-        with patch("pathlib.Path.exists", return_value=True), patch(
-            "pathlib.Path.is_file", return_value=True
-        ):
-            gcs_bucket.upload(local_file, bucket_path, overwrite=True)
+        gcs_bucket.upload(local_file, bucket_path, overwrite=True)
 
         mock_bucket.blob.assert_called_once_with(bucket_path)
-        mock_blob.upload_from_filename.assert_called_once_with(str(local_file))
+        mock_blob.upload_from_filename.assert_called_once_with(
+            local_file, if_generation_match=None
+        )
 
-    def test_upload_directory_with_subdirectories(self):
+    def test_upload_bytes(self, mocks, fake_path: SimpleNamespace):
+        mock_bucket, (mock_blob, *_) = mocks
+        mock_bucket.blob.return_value = mock_blob
+        mock_blob.exists.return_value = False
 
-        mock_bucket = MagicMock()
+        Bucket(mock_bucket).upload(b"content", "bucket/folder/file.bin")
+
+        mock_bucket.blob.assert_called_once_with("bucket/folder/file.bin")
+        mock_blob.upload_from_string.assert_called_once_with(
+            b"content", content_type="application/octet-stream", if_generation_match=0
+        )
+        mock_blob.upload_from_filename.assert_not_called()
+        fake_path.exists.assert_not_called()
+
+    def test_upload_compressed_text_file(self, mocks, tmp_path: Path):
+        mock_bucket, (mock_blob, *_) = mocks
+        mock_bucket.blob.return_value = mock_blob
+        local_file = tmp_path / "data.csv"
+        local_file.write_text("a,b\n1,2\n" * 100)
+
+        uploaded = {}
+
+        def read_upload(f, size, **kwargs):
+            uploaded.update(data=f.read(), size=size, kwargs=kwargs)
+
+        mock_blob.upload_from_file.side_effect = read_upload
+
+        Bucket(mock_bucket).upload(local_file, "folder/data.csv", compress=True)
+
+        assert gzip.decompress(uploaded["data"]) == local_file.read_bytes()
+        assert uploaded["size"] == len(uploaded["data"])
+        assert uploaded["kwargs"] == {
+            "content_type": "text/csv",
+            "if_generation_match": 0,
+        }
+        assert mock_blob.content_encoding == "gzip"
+        assert mock_blob.chunk_size == gcs.UPLOAD_CHUNK_SIZE
+        mock_blob.upload_from_filename.assert_not_called()
+        mock_blob.upload_from_string.assert_not_called()
+
+    def test_upload_compressed_bytes(self, mocks):
+        mock_bucket, (mock_blob, *_) = mocks
+        mock_bucket.blob.return_value = mock_blob
+
+        Bucket(mock_bucket).upload(b"content", "folder/file.bin", compress=True)
+
+        (data,), kwargs = mock_blob.upload_from_string.call_args
+        assert gzip.decompress(data) == b"content"
+        assert kwargs == {
+            "content_type": "application/octet-stream",
+            "if_generation_match": 0,
+        }
+        assert mock_blob.content_encoding == "gzip"
+
+    def test_upload_compress_skips_binary_file(self, mocks, tmp_path: Path):
+        mock_bucket, (mock_blob, *_) = mocks
+        mock_bucket.blob.return_value = mock_blob
+        local_file = tmp_path / "image.png"
+        local_file.write_bytes(b"\x89PNG")
+
+        Bucket(mock_bucket).upload(local_file, "folder/image.png", compress=True)
+
+        mock_blob.upload_from_filename.assert_called_once_with(
+            local_file, if_generation_match=0
+        )
+        mock_blob.upload_from_string.assert_not_called()
+
+    def test_upload_directory_with_subdirectories(
+        self, mocks, fake_path: SimpleNamespace, monkeypatch
+    ):
+
+        mock_bucket, _ = mocks
         gcs_bucket = Bucket(mock_bucket)
 
         # Mock directory and files
@@ -394,32 +835,199 @@ class TestUploadMock:
             local_directory / "subdir" / "file3.log",
         ]
 
-        # Mock rglob and existence checks
-        with (
-            patch("pathlib.Path.exists", return_value=True),
-            patch("pathlib.Path.is_dir", return_value=True),
-            patch("pathlib.Path.iterdir", return_value=files),
-            patch("pathlib.Path.rglob", return_value=files),
-        ):
-            # Mock individual file checks and uploads
-            with patch("pathlib.Path.is_file", side_effect=[False, True, True, True]):
-                gcs_bucket.upload(local_directory, bucket_path, overwrite=True)
+        # Mock the directory walk and existence checks
+        fake_path.is_file.return_value = False
+        fake_path.is_dir.return_value = True
+        fake_path.iterdir.return_value = files
+        monkeypatch.setattr(gcs, "_walk", MagicMock(return_value=iter(files)))
+
+        gcs_bucket.upload(local_directory, bucket_path, overwrite=True)
 
         for file in files:
             relative_path = file.relative_to(local_directory)
             bucket_file_path = f"{bucket_path}/{relative_path.as_posix()}"
             mock_bucket.blob.assert_any_call(bucket_file_path)
             mock_bucket.blob(bucket_file_path).upload_from_filename.assert_any_call(
-                str(file)
+                file, if_generation_match=None
             )
 
+    def test_upload_directory_existing_file_raises(
+        self, mocks, fake_path: SimpleNamespace, monkeypatch
+    ):
+        mock_bucket, _ = mocks
+        mock_bucket.blob.return_value.upload_from_filename.side_effect = (
+            PreconditionFailed("exists")
+        )
+        gcs_bucket = Bucket(mock_bucket)
+
+        local_directory = Path("local/directory")
+        files = [local_directory / "file1.txt", local_directory / "file2.txt"]
+        fake_path.is_file.return_value = False
+        fake_path.is_dir.return_value = True
+        fake_path.iterdir.return_value = files
+        monkeypatch.setattr(gcs, "_walk", MagicMock(return_value=iter(files)))
+
+        with pytest.raises(ValueError, match="already exists"):
+            gcs_bucket.upload(local_directory, "bucket/folder", max_workers=2)
+
+        mock_bucket.blob.return_value.exists.assert_not_called()
+
+
+def test_walk(tmp_path: Path):
+    (tmp_path / "subdir" / "nested").mkdir(parents=True)
+    for name in ["file1.txt", "subdir/file2.txt", "subdir/nested/file3.txt"]:
+        (tmp_path / name).write_text("content")
+
+    assert set(gcs._walk(tmp_path)) == {
+        tmp_path / "file1.txt",
+        tmp_path / "subdir/file2.txt",
+        tmp_path / "subdir/nested/file3.txt",
+    }
+
+
+@pytest.mark.mock
+def test_run_bounded_consumes_tasks_lazily():
+    release = threading.Event()
+    produced = []
+
+    def tasks():
+        for i in range(100):
+            produced.append(i)
+            yield (i,)
+
+    runner = threading.Thread(
+        target=gcs._run_bounded, args=(lambda i: release.wait(), tasks(), 2)
+    )
+    runner.start()
+    # 2 workers allow 8 pending tasks, the 9th task waits for a free slot.
+    deadline = time.monotonic() + 5
+    while len(produced) < 9 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.05)
+    assert len(produced) == 9
+
+    release.set()
+    runner.join()
+    assert len(produced) == 100
+
+
+@pytest.mark.mock
+class TestCompositeUploadMock:
+
+    @pytest.fixture(autouse=True)
+    def setup(self, monkeypatch, tmp_path: Path):
+        monkeypatch.setattr(gcs, "COMPOSITE_THRESHOLD", 10)
+        monkeypatch.setattr(gcs, "COMPOSITE_CHUNK_SIZE", 4)
+        monkeypatch.setattr(gcs.uuid, "uuid4", lambda: SimpleNamespace(hex="abc"))
+        self.mock_bucket = MagicMock()
+        self.blobs: Dict[str, MagicMock] = {}
+        self.mock_bucket.blob.side_effect = self._blob
+        self.gcs_bucket = Bucket(self.mock_bucket)
+        self.local_file = tmp_path / "large-file.bin"
+        self.part_names = [f"large-file.bin.abc.part{i}" for i in range(5)]
+
+    def _blob(self, name: str) -> MagicMock:
+        if name not in self.blobs:
+            self.blobs[name] = MagicMock()
+            self.blobs[name].name = name
+        return self.blobs[name]
+
+    def test_small_file_single_request(self):
+        self.local_file.write_bytes(b"0123")
+
+        self.gcs_bucket.upload(self.local_file, "small-file.bin", overwrite=True)
+
+        blob = self.blobs["small-file.bin"]
+        assert blob.chunk_size == gcs.UPLOAD_CHUNK_SIZE
+        blob.upload_from_filename.assert_called_once_with(
+            self.local_file, if_generation_match=None
+        )
+        blob.compose.assert_not_called()
+
+    def test_large_file_composed_from_parts(self):
+        content = b"0123456789abcdefghij"
+        self.local_file.write_bytes(content)
+        uploaded = {}
+
+        def read_part(f, size, rewind):
+            uploaded[f.tell()] = f.read(size)
+
+        for name in self.part_names:
+            self.mock_bucket.blob(name).upload_from_file.side_effect = read_part
+
+        self.gcs_bucket.upload(self.local_file, "large-file.bin", overwrite=True)
+
+        parts = [self.blobs[name] for name in self.part_names]
+        assert b"".join(uploaded[offset] for offset in sorted(uploaded)) == content
+        blob = self.blobs["large-file.bin"]
+        blob.compose.assert_called_once_with(parts, if_generation_match=None)
+        assert blob.content_type == "application/octet-stream"
+        blob.upload_from_filename.assert_not_called()
+        self.mock_bucket.client.batch.assert_called_once()
+        for part in parts:
+            part.delete.assert_called_once()
+
+    def test_existing_file_checked_before_parts(self):
+        self.local_file.write_bytes(b"0123456789abcdefghij")
+        blob = self.mock_bucket.blob("large-file.bin")
+        blob.exists.return_value = True
+
+        with pytest.raises(ValueError, match="already exists"):
+            self.gcs_bucket.upload(self.local_file, "large-file.bin")
+
+        blob.exists.assert_called_once()
+        blob.compose.assert_not_called()
+        assert not any(name in self.blobs for name in self.part_names)
+
+    def test_file_created_during_upload_checked_by_compose(self):
+        self.local_file.write_bytes(b"0123456789abcdefghij")
+        blob = self.mock_bucket.blob("large-file.bin")
+        blob.exists.return_value = False
+        blob.compose.side_effect = PreconditionFailed("exists")
+
+        with pytest.raises(ValueError, match="already exists"):
+            self.gcs_bucket.upload(self.local_file, "large-file.bin")
+
+        blob.compose.assert_called_once()
+        assert blob.compose.call_args.kwargs == {"if_generation_match": 0}
+        for name in self.part_names:
+            self.blobs[name].delete.assert_called_once()
+
+    def test_failed_part_deletes_parts(self):
+        self.local_file.write_bytes(b"0123456789abcdefghij")
+        self.mock_bucket.blob(self.part_names[2]).upload_from_file.side_effect = (
+            RuntimeError("upload failed")
+        )
+
+        with pytest.raises(RuntimeError, match="upload failed"):
+            self.gcs_bucket.upload(self.local_file, "large-file.bin", overwrite=True)
+
+        self.blobs["large-file.bin"].compose.assert_not_called()
+        for name in self.part_names:
+            self.blobs[name].delete.assert_called_once()
 
+    def test_failed_cleanup_keeps_upload_error(self):
+        self.local_file.write_bytes(b"0123456789abcdefghij")
+        self.mock_bucket.blob(self.part_names[2]).upload_from_file.side_effect = (
+            RuntimeError("upload failed")
+        )
+        self.mock_bucket.blob(self.part_names[0]).delete.side_effect = RuntimeError(
+            "delete failed"
+        )
+
+        with pytest.raises(RuntimeError, match="upload failed"):
+            self.gcs_bucket.upload(self.local_file, "large-file.bin", overwrite=True)
+
+        for name in self.part_names:
+            self.blobs[name].delete.assert_called_once()
+
+
+@pytest.mark.xdist_group(name="gcs_delete_mock")
 class TestDeleteMock:
 
     @pytest.mark.mock
-    def test_delete_single_file(self):
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+    def test_delete_single_file(self, mocks):
+        mock_bucket, (mock_blob, *_) = mocks
         mock_bucket.blob.return_value = mock_blob
         mock_blob.exists.return_value = True
 
@@ -432,9 +1040,8 @@ class TestDeleteMock:
         mock_blob.delete.assert_called_once()
 
     @pytest.mark.mock
-    def test_delete_single_file_not_found(self):
-        mock_bucket = MagicMock()
-        mock_blob = MagicMock()
+    def test_delete_single_file_not_found(self, mocks):
+        mock_bucket, (mock_blob, *_) = mocks
         mock_bucket.blob.return_value = mock_blob
         mock_blob.exists.return_value = False
 
@@ -450,27 +1057,61 @@ class TestDeleteMock:
         mock_blob.delete.assert_not_called()
 
     @pytest.mark.mock
-    def test_delete_directory(self):
-        mock_bucket = MagicMock()
-        mock_blob1 = MagicMock()
-        mock_blob1.name = "data/file1.txt"
-        mock_blob2 = MagicMock()
-        mock_blob2.name = "data/subdir/file2.txt"
-        mock_bucket.list_blobs.return_value = [mock_blob1, mock_blob2]
+    def test_delete_directory(self, mocks, fake_blobs: List[SimpleNamespace]):
+        mock_bucket, _ = mocks
+        mock_bucket.list_blobs.return_value = fake_blobs
 
         gcs_bucket = Bucket(mock_bucket)
 
         directory = "data/"
         gcs_bucket.delete(directory)
 
-        mock_bucket.list_blobs.assert_called_once_with(prefix=directory)
-        mock_blob1.delete.assert_called_once()
-        mock_blob2.delete.assert_called_once()
+        mock_bucket.list_blobs.assert_called_once_with(
+            prefix=directory, fields=gcs.LIST_FIELDS
+        )
+        for blob in fake_blobs:
+            blob.delete.assert_called_once()
 
     @pytest.mark.mock
-    def test_delete_directory_empty(self):
+    def test_delete_directory_uses_batch(
+        self, mocks, fake_blobs: List[SimpleNamespace]
+    ):
+        mock_bucket, _ = mocks
+        mock_bucket.list_blobs.return_value = fake_blobs
 
+        gcs_bucket = Bucket(mock_bucket)
+        gcs_bucket.delete("data/")
+
+        mock_bucket.client.batch.assert_called_once()
+        mock_bucket.client.batch.return_value.__enter__.assert_called_once()
+        mock_bucket.client.batch.return_value.__exit__.assert_called_once()
+
+    @pytest.mark.mock
+    def test_delete_directory_in_batches_of_100(self):
         mock_bucket = MagicMock()
+        events = []
+        batch = mock_bucket.client.batch.return_value
+        batch.__enter__.side_effect = lambda: events.append("enter")
+        batch.__exit__.side_effect = lambda *args: events.append("exit")
+        mock_bucket.list_blobs.return_value = [
+            SimpleNamespace(
+                name=f"data/file{i}.txt", delete=lambda: events.append("delete")
+            )
+            for i in range(250)
+        ]
+
+        Bucket(mock_bucket).delete("data/")
+
+        assert mock_bucket.client.batch.call_count == 3
+        expected = []
+        for size in [100, 100, 50]:
+            expected += ["enter"] + ["delete"] * size + ["exit"]
+        assert events == expected
+
+    @pytest.mark.mock
+    def test_delete_directory_empty(self, mocks):
+
+        mock_bucket, _ = mocks
         mock_bucket.list_blobs.return_value = []
 
         gcs_bucket = Bucket(mock_bucket)
@@ -481,7 +1122,9 @@ class TestDeleteMock:
         ):
             gcs_bucket.delete(directory)
 
-        mock_bucket.list_blobs.assert_called_once_with(prefix=directory)
+        mock_bucket.list_blobs.assert_called_once_with(
+            prefix=directory, fields=gcs.LIST_FIELDS
+        )
 
 
 class TestGCSBucketRename(unittest.TestCase):
@@ -495,7 +1138,9 @@ class TestGCSBucketRename(unittest.TestCase):
         self.mock_bucket.list_blobs.side_effect = [[old_blob], []]
 
         # Call the rename method
-        self.bucket.rename("old_path/file.txt", "new_path/file.txt")
+        old_blob.name = "old_path/file.txt"
+        renamed = self.bucket.rename("old_path/file.txt", "new_path/file.txt")
+        self.assertEqual(renamed, ["new_path/file.txt"])
 
         # Verify the copy and delete operations
         self.mock_bucket.blob("new_path/file.txt").rewrite.assert_called_once_with(
@@ -510,18 +1155,23 @@ class TestGCSBucketRename(unittest.TestCase):
         self.mock_bucket.list_blobs.side_effect = [[old_blob_1, old_blob_2], []]
 
         # Call the rename method
-        self.bucket.rename("old_path/dir/", "new_path/dir/")
+        old_blob_1.name = "old_path/dir/file1.txt"
+        old_blob_2.name = "old_path/dir/file2.txt"
+        renamed = self.bucket.rename("old_path/dir/", "new_path/dir/")
+        self.assertEqual(renamed, ["new_path/dir/file1.txt", "new_path/dir/file2.txt"])
 
-        # Verify the copy and delete operations for each file
+        # Verify the copy and delete operations for each file, the copies run concurrently
         expected_calls = [call(old_blob_1), call(old_blob_2)]
-        self.mock_bucket.blob("new_path/dir/file1.txt").rewrite.assert_has_calls(
-            [expected_calls[0]]
+        self.mock_bucket.blob.assert_has_calls(
+            [call("new_path/dir/file1.txt"), call("new_path/dir/file2.txt")],
+            any_order=True,
         )
-        self.mock_bucket.blob("new_path/dir/file2.txt").rewrite.assert_has_calls(
-            [expected_calls[1]]
+        self.mock_bucket.blob.return_value.rewrite.assert_has_calls(
+            expected_calls, any_order=True
         )
         old_blob_1.delete.assert_called_once()
         old_blob_2.delete.assert_called_once()
+        self.mock_bucket.client.batch.assert_called_once()
 
     def test_rename_nonexistent_path(self):
         # Mock the list_blobs method to return an empty list
@@ -1,7 +1,9 @@
 import base64
 import json
 import os
+import tempfile
 import unittest
+from pathlib import Path
 
 from unicloud.utils import decode, encode
 
@@ -9,16 +11,19 @@ from unicloud.utils import decode, encode
 class TestEncodeDecode(unittest.TestCase):
     def setUp(self):
         """Setup a mock service account file and content for testing."""
-        self.mock_file_name = "mock_service_account.json"
+        # a directory per test, so tests running in parallel do not share the file
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.mock_file_name = os.path.join(
+            self.tmp_dir.name, "mock_service_account.json"
+        )
         self.mock_content = {"type": "service_account", "project_id": "your_project_id"}
         self.json_content = json.dumps(self.mock_content)
-        with open(self.mock_file_name, "w") as mock_file:
-            json.dump(self.mock_content, mock_file)
+        Path(self.mock_file_name).write_text(json.dumps(self.mock_content))
         self.encoded_content = base64.b64encode(json.dumps(self.mock_content).encode())
 
     def tearDown(self):
         """Clean up mock file after tests run."""
-        os.remove(self.mock_file_name)
+        self.tmp_dir.cleanup()
 
     def test_encode_with_path(self):
         # Test encoding with a file path